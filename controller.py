@@ -3,7 +3,7 @@ import os  # FIXED: Missing import that caused NameError
 import logging
 import threading
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Callable
 from processing.extract import load_file
 from processing.clean import clean_text
 from processing.splitter import split_text  # Keep existing basic splitter
@@ -42,6 +42,7 @@ class ProcessingController:
         self._premium_features_loading = True
         self._premium_features_loaded = False
         self._loading_callbacks = []
+        self.tokenizer_version = 0  # bumped whenever tokenizer availability or access may change
         
         # Initialize license manager with fallback
         self._initialize_license_manager()
@@ -137,6 +138,7 @@ class ProcessingController:
     def _on_tokenizer_loaded(self, tokenizer_name: str, status: str):
         """Handle tokenizer loading status updates"""
         logging.info(f"Tokenizer {tokenizer_name} status: {status}")
+        self.invalidate_tokenizer_cache()
         
         # Notify UI about tokenizer availability changes
         for callback in self._loading_callbacks:
@@ -147,12 +149,17 @@ class ProcessingController:
 
     def _notify_premium_loaded(self):
         """Notify callbacks that premium features are ready"""
+        self.invalidate_tokenizer_cache()
         for callback in self._loading_callbacks:
             try:
                 callback('premium_features', 'all', 'loaded')
             except Exception as e:
                 logging.warning(f"Premium loading callback failed: {e}")
 
+    def invalidate_tokenizer_cache(self):
+        """Signal that cached tokenizer listings are stale"""
+        self.tokenizer_version += 1
+
     def register_loading_callback(self, callback):
         """Register callback for loading status updates"""
         self._loading_callbacks.append(callback)
@@ -360,12 +367,19 @@ class ProcessingController:
 
     def analyze_chunks_with_costs(self, chunks: List[str], tokenizer_name: str = 'word_estimator',
                                  token_limit: int = 512, target_models: Optional[List[str]] = None,
-                                 api_usage_monthly: int = 100000) -> Dict[str, Any]:
+                                 api_usage_monthly: int = 100000,
+                                 progress_cb: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Enhanced analysis method with comprehensive cost analysis
         COMPLETE COMPATIBILITY with existing cost dialogs
+        progress_cb, if given, receives a short status message as each stage starts
         """
+        def report(message):
+            if progress_cb:
+                progress_cb(message)
+        
         # Start with standard analysis
+        report("Counting tokens...")
         analysis = self.analyze_chunks(chunks, tokenizer_name, token_limit)
         
         # Check if user has access to advanced cost analysis
@@ -402,6 +416,7 @@ class ProcessingController:
             # Perform cost analysis for each target model
             cost_analyses = {}
             for model_name in target_models:
+                report(f"Calculating training costs for {model_name}...")
                 try:
                     cost_result = self.cost_calculator.calculate_comprehensive_costs(
                         dataset_tokens=analysis['total_tokens'],
@@ -417,6 +432,7 @@ class ProcessingController:
                     }
             
             # Add comprehensive cost analysis to results
+            report("Generating optimization recommendations...")
             analysis['cost_analysis'] = {
                 'available': True,
                 'models_analyzed': list(cost_analyses.keys()),
@@ -752,7 +768,10 @@ class ProcessingController:
         """Start premium trial with fallback"""
         if self._license_manager_available and self.license_manager:
             try:
-                return self.license_manager.start_trial()
+                started = self.license_manager.start_trial()
+                if started:
+                    self.invalidate_tokenizer_cache()
+                return started
             except Exception as e:
                 logging.warning(f"Trial start failed: {e}")
         return False
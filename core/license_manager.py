@@ -46,6 +46,7 @@ class LicenseManager:
         self.license_file_path = os.path.join(os.getcwd(), ".wolfscribe_license")
         self.trial_file_path = os.path.join(os.getcwd(), ".wolfscribe_trial")
         self._license_info: Optional[LicenseInfo] = None
+        self._access_cache: Dict[str, bool] = {}  # tokenizer name -> access, reset on license reload
         self._feature_definitions = self._build_feature_definitions()
         self._initialize_license()
 
@@ -102,6 +103,8 @@ class LicenseManager:
 
     def _initialize_license(self):
         """Initialize license status on startup"""
+        self._access_cache.clear()
+        
         # Check for demo mode (environment variable)
         if os.getenv('WOLFSCRIBE_DEMO', '').lower() in ['true', '1', 'yes']:
             self._license_info = LicenseInfo(
@@ -290,10 +293,17 @@ class LicenseManager:
 
     def check_tokenizer_access(self, tokenizer_name: str) -> bool:
         """Check if user has access to a specific tokenizer"""
+        cached = self._access_cache.get(tokenizer_name)
+        if cached is not None:
+            return cached
+        
         if not self.check_feature_access('advanced_tokenizers'):
             # Only GPT-2 available in free tier
-            return tokenizer_name == 'gpt2'
-        return True
+            has_access = tokenizer_name == 'gpt2'
+        else:
+            has_access = True
+        self._access_cache[tokenizer_name] = has_access
+        return has_access
 
     def get_license_status(self) -> LicenseInfo:
         """Get current license information"""
@@ -8,6 +8,47 @@ class SessionFile:
     config: Dict = field(default_factory=dict)
     chunks: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict:
+        return {
+            "path": self.path,
+            "tag": self.tag,
+            "config": self.config,
+            "chunks": self.chunks
+        }
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'SessionFile':
+        return SessionFile(
+            path=data["path"],
+            tag=data.get("tag"),
+            config=data.get("config", {}),
+            chunks=data.get("chunks", [])
+        )
+
+@dataclass
+class UIPreferences:
+    selected_tokenizer: str = 'gpt2'
+    split_method: str = 'paragraph'
+    token_limit: int = 512
+    theme: str = 'modern_slate'
+
+    def to_dict(self) -> Dict:
+        return {
+            "selected_tokenizer": self.selected_tokenizer,
+            "split_method": self.split_method,
+            "token_limit": self.token_limit,
+            "theme": self.theme
+        }
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'UIPreferences':
+        return UIPreferences(
+            selected_tokenizer=data.get("selected_tokenizer", 'gpt2'),
+            split_method=data.get("split_method", 'paragraph'),
+            token_limit=data.get("token_limit", 512),
+            theme=data.get("theme", 'modern_slate')
+        )
+
 @dataclass
 class Session:
     files: List[SessionFile] = field(default_factory=list)
@@ -19,25 +60,8 @@ class Session:
         return [chunk for f in self.files for chunk in f.chunks]
 
     def to_dict(self) -> Dict:
-        return {
-            "files": [
-                {
-                    "path": f.path,
-                    "tag": f.tag,
-                    "config": f.config,
-                    "chunks": f.chunks
-                } for f in self.files
-            ]
-        }
+        return {"files": [f.to_dict() for f in self.files]}
 
     @staticmethod
     def from_dict(data: Dict) -> 'Session':
-        session = Session()
-        for file_data in data.get("files", []):
-            session.files.append(SessionFile(
-                path=file_data["path"],
-                tag=file_data.get("tag"),
-                config=file_data.get("config", {}),
-                chunks=file_data.get("chunks", [])
-            ))
-        return session
\ No newline at end of file
+        return Session(files=[SessionFile.from_dict(file_data) for file_data in data.get("files", [])])
\ No newline at end of file
@@ -4,30 +4,96 @@
 import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, PhotoImage
-from ttkbootstrap import Frame, Label, Button, Entry, Combobox, Scrollbar
+from ttkbootstrap import Frame, Label, Button, Scrollbar
 from ttkbootstrap.constants import *
-from ttkbootstrap.tooltip import ToolTip
 from controller import ProcessingController
 from export.dataset_exporter import save_as_txt, save_as_csv
 from tkinterdnd2 import DND_FILES
 import json
-from session import Session
+import logging
+from functools import lru_cache
+from session import Session, UIPreferences
 from ui.styles import MODERN_SLATE
-from ui.cost_dialogs import CostAnalysisDialogs
+from ui.cost_dialogs import CostAnalysisDialogs, wheel_events
 from ui.preview_dialogs import PreviewDialogs
 from ui.section_builders import SectionBuilder
 from ui.progressive_loading_dialog import ProgressiveLoadingDialog  # ADD: Progressive loading import
 
 # Removed unused imports from cleanup
+from concurrent.futures import Future
 import threading
 import time
-from datetime import datetime
 
 TOKEN_LIMIT = 512
+ALLOWED_EXTS = frozenset({".txt", ".pdf", ".epub", ".docx", ".csv"})
+INFO_CACHE_TTL = 5.0  # seconds to reuse tokenizer/licensing lookups
+STATUS_FLASH_MS = 3000  # how long a status bar message stays visible
+STATUS_COLORS = {"info": MODERN_SLATE['text_secondary'], "success": MODERN_SLATE['success'],
+                 "warning": MODERN_SLATE['warning']}
+# json.dumps options for session files: compact by default, indented when pretty=True
+SESSION_JSON_COMPACT = {"ensure_ascii": False, "separators": (",", ":")}
+SESSION_JSON_PRETTY = {"ensure_ascii": False, "indent": 2}
+ICON_DIR_24 = os.path.join("assets", "icons", "24px")
+ICON_DIR_36 = os.path.join("assets", "icons", "36px")
+
+
+@lru_cache(maxsize=None)
+def _load_icon(path):
+    """Load an icon file once and share the PhotoImage across AppFrame instances"""
+    return PhotoImage(file=path)
+
+
+# Logical icon name -> (directory, file name)
+ICON_FILES = {
+    # 24px icons for buttons
+    "file": (ICON_DIR_24, "upload_file.png"),
+    "clean": (ICON_DIR_24, "tune.png"),
+    "preview": (ICON_DIR_24, "visibility.png"),
+    "export_txt": (ICON_DIR_24, "description.png"),
+    "export_csv": (ICON_DIR_24, "table_view.png"),
+    "save": (ICON_DIR_24, "save.png"),
+    "file_up": (ICON_DIR_24, "folder_open.png"),
+    "cost_analysis": (ICON_DIR_24, "analytics.png"),
+    "settings": (ICON_DIR_24, "settings.png"),
+    "premium": (ICON_DIR_24, "diamond.png"),
+    
+    # 36px icons for headers
+    "file_header": (ICON_DIR_36, "folder_open.png"),
+    "preprocessing_header": (ICON_DIR_36, "tune.png"),
+    "preview_header": (ICON_DIR_36, "visibility.png"),
+    "export_header": (ICON_DIR_36, "upload_file.png"),
+    "session_header": (ICON_DIR_36, "save.png"),
+    "premium_header": (ICON_DIR_36, "diamond.png"),
+}
+
+
+class _LazyIcons(dict):
+    """Icon map that loads each PhotoImage the first time its key is looked up"""
+
+    def __init__(self):
+        super().__init__()
+        self._failed = False  # set by the first load failure; later keys get no icon
+
+    def __missing__(self, key):
+        path = os.path.join(*ICON_FILES[key])
+        icon = None
+        if not self._failed:
+            try:
+                icon = _load_icon(path)
+            except Exception as e:
+                logging.warning(f"Icon loading failed: {e} - using text-only buttons as fallback")
+                self._failed = True
+        self[key] = icon
+        return icon
+
 
 class AppFrame(Frame):
     def __init__(self, parent):
         super().__init__(parent, style="Modern.TFrame")
+        
+        # Screen size for centering dialogs, queried once instead of per dialog
+        self._scr_w = self.winfo_screenwidth()
+        self._scr_h = self.winfo_screenheight()
 
         # Initialize the enhanced controller
         self.controller = ProcessingController()
@@ -37,14 +103,22 @@ class AppFrame(Frame):
         self.preview_dialogs = PreviewDialogs(self, self.controller)
         
         # Setup scrollable canvas
+        self._cfg_after = None  # pending debounced scroll region update
+        self._status_after = None  # pending status bar clear
+        self._scroll_delta = 0  # wheel steps accumulated since the last flush
+        self._scroll_pending = None  # pending coalesced scroll
         self._setup_canvas()
         
         # State variables
         self.file_path = None
+        self._file_basename = 'Unknown'
         self.chunks = []
         self.session = Session()
+        self._session_version = 0
+        self._session_cache = None  # (session version, pretty flag, serialized "files" JSON)
         self.current_analysis = None
         self.progressive_loading = None  # ADD: Progressive loading instance variable
+        self._process_future = None  # file processing currently running in the background
         
         # UI component references (will be set by SectionBuilder)
         self.file_label = None
@@ -55,10 +129,21 @@ class AppFrame(Frame):
         self.tokenizer_dropdown = None
         self.license_status_label = None
         self.premium_section = None
+        self.process_button = None
+        self._upgrade_frame = None
+        self._trial_frame = None
+        self._trial_days_label = None
         
         # Tokenizer state
         self.tokenizer_options = []
+        self._tok_by_name = {}
+        self._tok_by_display = {}
         self._current_tokenizer_name = 'gpt2'
+        self._previous_display = "GPT-2 (Free)"  # last accepted dropdown label
+        self._tok_cache = None
+        self._tok_cache_ts = 0
+        self._license_info_cache = None
+        self._license_info_cache_ts = 0
         
         # Setup UI
         self._setup_icons()
@@ -67,7 +152,8 @@ class AppFrame(Frame):
         # Post-setup initialization
         self.update_tokenizer_dropdown()
         self.update_license_status()
-        self.update_premium_section()
+        # Premium cards aren't needed for the first paint; build them once the loop is idle
+        self.after_idle(self.update_premium_section)
         
         # ADD: Initialize progressive loading after controller is ready
         self.initialize_progressive_loading()
@@ -115,10 +201,7 @@ class AppFrame(Frame):
                                      style="Modern.TFrame")
 
         # Configure canvas scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._on_configure)
 
         self.canvas_frame = self.canvas.create_window((0, 0), 
                                                      window=self.scrollable_frame, 
@@ -126,6 +209,11 @@ class AppFrame(Frame):
                                                      width=700)
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
+        # Status bar for non-blocking confirmations, always visible below the canvas
+        self.status_label = Label(self, text="", anchor="w", padding=(25, 4),
+                                  style="Secondary.TLabel")
+        self.status_label.pack(side="bottom", fill="x")
+
         # Pack canvas and scrollbar
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
@@ -137,116 +225,67 @@ class AppFrame(Frame):
         self.drop_target_register(DND_FILES)
         self.dnd_bind('<<Drop>>', self.handle_file_drop)
 
+    def _on_configure(self, event):
+        """Debounce scroll region updates so a resize storm only measures the canvas once"""
+        if self._cfg_after:
+            self.after_cancel(self._cfg_after)
+        self._cfg_after = self.after(50, self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Keep the canvas scroll region in sync with the scrollable frame's size"""
+        self._cfg_after = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def _setup_mousewheel_binding(self):
-        """Setup comprehensive mousewheel binding for all UI elements"""
-        
-        def on_mousewheel(event):
-            """Handle mouse wheel scrolling with cross-platform support"""
-            try:
-                # Check if this is a dialog window (should not scroll main canvas)
-                widget = event.widget
-                while widget:
-                    # If we find a Toplevel window, this is a dialog - don't scroll main canvas
-                    if isinstance(widget, tk.Toplevel):
-                        return
-                    widget = widget.master
-                
-                # Calculate scroll delta with cross-platform support
-                if hasattr(event, 'delta') and event.delta:
-                    # Windows/Mac: event.delta is in multiples of 120
-                    delta = int(-1 * (event.delta / 120))
-                elif hasattr(event, 'num'):
-                    # Linux: event.num indicates scroll direction
-                    delta = -1 if event.num == 4 else 1
-                else:
-                    # Fallback
-                    delta = -1
-                
-                # Perform the scroll
-                self.canvas.yview_scroll(delta, "units")
-                
-            except (tk.TclError, AttributeError):
-                # Widget may have been destroyed or other edge case - ignore
-                pass
+        """Route mouse wheel events to the canvas only while the pointer is over it"""
+        self._wheel_events = wheel_events(self)
+        self.canvas.bind("<Enter>", self._bind_wheel)
+        self.canvas.bind("<Leave>", self._unbind_wheel)
+
+    def _bind_wheel(self, event=None):
+        """Start handling wheel events while the pointer is over the main canvas"""
+        for sequence in self._wheel_events:
+            self.canvas.bind_all(sequence, self._on_wheel)
+
+    def _unbind_wheel(self, event=None):
+        """Stop handling wheel events once the pointer has really left the canvas"""
+        # Moving onto a child widget also sends <Leave>; only unbind outside the canvas area
+        x, y = self.canvas.winfo_pointerxy()
+        left, top = self.canvas.winfo_rootx(), self.canvas.winfo_rooty()
+        if left <= x < left + self.canvas.winfo_width() and top <= y < top + self.canvas.winfo_height():
+            return
+        for sequence in self._wheel_events:
+            self.canvas.unbind_all(sequence)
 
-        def bind_mousewheel_recursive(widget):
-            """Recursively bind mousewheel events to widget and all children"""
-            try:
-                # Bind mousewheel events to this widget
-                widget.bind("<MouseWheel>", on_mousewheel, add="+")  # Windows/Mac
-                widget.bind("<Button-4>", lambda e: on_mousewheel(type('obj', (object,), {
-                    'delta': 120, 'widget': e.widget, 'num': 4
-                })()), add="+")  # Linux scroll up
-                widget.bind("<Button-5>", lambda e: on_mousewheel(type('obj', (object,), {
-                    'delta': -120, 'widget': e.widget, 'num': 5
-                })()), add="+")  # Linux scroll down
-                
-                # Recursively bind to all children
-                for child in widget.winfo_children():
-                    bind_mousewheel_recursive(child)
-                    
-            except (tk.TclError, AttributeError):
-                # Some widgets may not support binding - skip them
-                pass
+    def _on_wheel(self, event):
+        """Accumulate wheel steps and scroll the main canvas once per burst"""
+        try:
+            # Dialogs stacked over the canvas scroll themselves, not the main window
+            if event.widget.winfo_toplevel() is not self.winfo_toplevel():
+                return
+        except (AttributeError, KeyError, tk.TclError):
+            # Widget may have been destroyed or is not a Tk widget object - ignore
+            return
+        
+        self._scroll_delta += -1 if event.num == 4 or event.delta > 0 else 1
+        if self._scroll_pending is None:
+            self._scroll_pending = self.after(10, self._flush_scroll)
 
-        # Bind to the main scrollable frame and all its descendants
-        bind_mousewheel_recursive(self.scrollable_frame)
-        
-        # Also bind to the canvas itself for any empty areas
-        self.canvas.bind("<MouseWheel>", on_mousewheel)
-        self.canvas.bind("<Button-4>", lambda e: on_mousewheel(type('obj', (object,), {
-            'delta': 120, 'widget': e.widget, 'num': 4
-        })()))
-        self.canvas.bind("<Button-5>", lambda e: on_mousewheel(type('obj', (object,), {
-            'delta': -120, 'widget': e.widget, 'num': 5
-        })()))
-
-    def refresh_mousewheel_bindings(self):
-        """Refresh mousewheel bindings - call this after UI updates"""
-        # This method can be called when new widgets are added to ensure they get scroll bindings
-        self._setup_mousewheel_binding()
+    def _flush_scroll(self):
+        """Apply the accumulated wheel steps in a single yview_scroll"""
+        self._scroll_pending = None
+        delta, self._scroll_delta = self._scroll_delta, 0
+        if delta:
+            self.canvas.yview_scroll(delta, "units")
 
     def _setup_icons(self):
         """Setup Material Design icons with multiple sizes"""
-        # Icon loading functions for different sizes
-        self.icon_24 = lambda name: PhotoImage(file=f"assets/icons/24px/{name}")
-        self.icon_36 = lambda name: PhotoImage(file=f"assets/icons/36px/{name}")
+        # Icon loading functions for different sizes (each file is only read once per process)
+        self.icon_24 = lambda name: _load_icon(os.path.join(ICON_DIR_24, name))
+        self.icon_36 = lambda name: _load_icon(os.path.join(ICON_DIR_36, name))
         
-        try:
-            self.icons = {
-                # 24px icons for buttons
-                "file": self.icon_24("upload_file.png"),
-                "clean": self.icon_24("tune.png"),
-                "preview": self.icon_24("visibility.png"),
-                "export_txt": self.icon_24("description.png"),
-                "export_csv": self.icon_24("table_view.png"),
-                "save": self.icon_24("save.png"),
-                "file_up": self.icon_24("folder_open.png"),
-                "cost_analysis": self.icon_24("analytics.png"),
-                "settings": self.icon_24("settings.png"),
-                "premium": self.icon_24("diamond.png"),
-                
-                # 36px icons for headers
-                "file_header": self.icon_36("folder_open.png"),
-                "preprocessing_header": self.icon_36("tune.png"),
-                "preview_header": self.icon_36("visibility.png"),
-                "export_header": self.icon_36("upload_file.png"),
-                "session_header": self.icon_36("save.png"),
-                "premium_header": self.icon_36("diamond.png"),
-            }
-
-            
-        except Exception as e:
-            print(f"⚠️ Icon loading failed: {e}")
-            # Enhanced fallback for all expected keys
-            icon_keys = [
-                "file", "clean", "preview", "export_txt", "export_csv", "save", "file_up",
-                "cost_analysis", "settings", "premium",
-                "file_header", "preprocessing_header", "preview_header", 
-                "export_header", "session_header", "premium_header"
-            ]
-            self.icons = {key: None for key in icon_keys}
-            print("📦 Using text-only buttons as fallback")
+        # Each icon is loaded when its section first looks it up
+        self.icons = _LazyIcons()
 
     def _setup_modern_ui(self):
         """SIMPLIFIED: Setup main UI layout using SectionBuilder"""
@@ -313,10 +352,31 @@ class AppFrame(Frame):
     # CORE APPLICATION METHODS 
     # =============================================================================
 
+    def _get_tokenizers(self):
+        """Available tokenizers, reused for a few seconds to avoid re-enumerating per click"""
+        now = time.monotonic()
+        if self._tok_cache is None or now - self._tok_cache_ts >= INFO_CACHE_TTL:
+            self._tok_cache = self.controller.get_available_tokenizers()
+            self._tok_cache_ts = now
+        return self._tok_cache
+
+    def _get_licensing_info(self):
+        """Licensing info, reused for a few seconds to avoid re-checking per click"""
+        now = time.monotonic()
+        if self._license_info_cache is None or now - self._license_info_cache_ts >= INFO_CACHE_TTL:
+            self._license_info_cache = self.controller.get_licensing_info()
+            self._license_info_cache_ts = now
+        return self._license_info_cache
+
+    def invalidate_license_caches(self):
+        """Drop cached tokenizer and licensing info after the license changes"""
+        self._tok_cache = None
+        self._license_info_cache = None
+
     def update_tokenizer_dropdown(self):
         """Update tokenizer dropdown with available options"""
         try:
-            tokenizers = self.controller.get_available_tokenizers()
+            tokenizers = self._get_tokenizers()
             self.tokenizer_options = []
             display_names = []
             
@@ -333,6 +393,13 @@ class AppFrame(Frame):
             
             self.tokenizer_dropdown['values'] = display_names
             
+            # Index by name and by every label the dropdown can show
+            self._tok_by_name = {t['name']: t for t in tokenizers}
+            self._tok_by_display = {t['display_name']: t for t in tokenizers}
+            self._tok_by_display.update(
+                {f"🔒 {t['display_name']}": t for t in tokenizers if not t['has_access']}
+            )
+            
             # Set default to first available tokenizer
             available_tokenizers = [t for t in tokenizers if t['has_access'] and t['available']]
             if available_tokenizers:
@@ -342,6 +409,7 @@ class AppFrame(Frame):
             else:
                 self.selected_tokenizer.set("GPT-2 (Free)")
                 self._current_tokenizer_name = 'gpt2'
+            self._previous_display = self.selected_tokenizer.get()
                 
         except Exception as e:
             messagebox.showerror("Tokenizer Error", f"Failed to load tokenizers: {str(e)}")
@@ -352,7 +420,7 @@ class AppFrame(Frame):
     def update_license_status(self):
         """Update license status display with modern colors"""
         try:
-            license_info = self.controller.get_licensing_info()
+            license_info = self._get_licensing_info()
             status = license_info['license_status']
             
             if status['status'] == 'demo':
@@ -388,54 +456,66 @@ class AppFrame(Frame):
                 style="Secondary.TLabel"
             )
 
+    def _build_premium_section(self):
+        """Create the premium section's upgrade and trial views once; updates only toggle them"""
+        # Upgrade view for free users
+        self._upgrade_frame = Frame(self.premium_section, style="Modern.TFrame")
+        
+        header_frame = Frame(self._upgrade_frame, style="Modern.TFrame")
+        header_frame.pack(fill="x", pady=(0, 12))
+
+        Label(header_frame, image=self.icons["premium_header"], compound="left").pack(side="left")
+        Label(header_frame, text=" Premium Features", style="Heading.TLabel").pack(side="left")
+
+        upgrade_button = Button(self._upgrade_frame, 
+                              image=self.icons["premium"],
+                              text="  Start Free Trial", 
+                              compound="left",
+                              command=self.start_trial, 
+                              style="Premium.TButton")
+        upgrade_button.pack(fill="x", pady=(0, 8))
+        
+        upgrade_info_button = Button(self._upgrade_frame, 
+                                   image=self.icons["settings"],
+                                   text="  View Premium Features", 
+                                   compound="left",
+                                   command=self.show_upgrade_info, 
+                                   style="Secondary.TButton")
+        upgrade_info_button.pack(fill="x")
+        
+        # Trial status view
+        self._trial_frame = Frame(self.premium_section, style="Modern.TFrame")
+        
+        Label(self._trial_frame, text="💎 Premium Trial Active", 
+              style="Heading.TLabel").pack(anchor="w", pady=(0, 8))
+        
+        self._trial_days_label = Label(self._trial_frame, style="Warning.TLabel")
+        self._trial_days_label.pack(anchor="w", pady=(0, 12))
+        
+        upgrade_button = Button(self._trial_frame, text="💎 Upgrade to Full License", 
+                              command=self.show_upgrade_info, 
+                              style="Premium.TButton")
+        upgrade_button.pack(fill="x")
+
     def update_premium_section(self):
         """Update premium section with modern card styling"""
         try:
-            license_info = self.controller.get_licensing_info()
+            license_info = self._get_licensing_info()
+            
+            if self._upgrade_frame is None:
+                self._build_premium_section()
             
-            # Clear existing premium section
-            for widget in self.premium_section.winfo_children():
-                widget.destroy()
+            # Hide both views, then show the one matching the license state
+            self._upgrade_frame.pack_forget()
+            self._trial_frame.pack_forget()
             
             if not license_info['premium_licensed']:
-                header_frame = Frame(self.premium_section, style="Modern.TFrame")
-                header_frame.pack(fill="x", pady=(0, 12))
-
-                Label(header_frame, image=self.icons["premium_header"], compound="left").pack(side="left")
-                Label(header_frame, text=" Premium Features", style="Heading.TLabel").pack(side="left")
-
-                upgrade_button = Button(self.premium_section, 
-                                      image=self.icons["premium"],
-                                      text="  Start Free Trial", 
-                                      compound="left",
-                                      command=self.start_trial, 
-                                      style="Premium.TButton")
-                upgrade_button.pack(fill="x", pady=(0, 8))
-                
-                upgrade_info_button = Button(self.premium_section, 
-                                           image=self.icons["settings"],
-                                           text="  View Premium Features", 
-                                           compound="left",
-                                           command=self.show_upgrade_info, 
-                                           style="Secondary.TButton")
-                upgrade_info_button.pack(fill="x")
+                self._upgrade_frame.pack(fill="x")
             else:
                 status = license_info['license_status']
                 if status['status'] == 'trial' and status.get('days_remaining'):
-                    Label(self.premium_section, text="💎 Premium Trial Active", 
-                          style="Heading.TLabel").pack(anchor="w", pady=(0, 8))
-                    
-                    Label(self.premium_section, 
-                          text=f"Trial expires in {status['days_remaining']} days", 
-                          style="Warning.TLabel").pack(anchor="w", pady=(0, 12))
-                    
-                    upgrade_button = Button(self.premium_section, text="💎 Upgrade to Full License", 
-                                          command=self.show_upgrade_info, 
-                                          style="Premium.TButton")
-                    upgrade_button.pack(fill="x")
-                    
-            # Refresh scroll bindings after updating premium section
-            self.refresh_mousewheel_bindings()
+                    self._trial_days_label.config(text=f"Trial expires in {status['days_remaining']} days")
+                    self._trial_frame.pack(fill="x")
                     
         except Exception as e:
             pass  # Silently fail for premium section
@@ -444,21 +524,19 @@ class AppFrame(Frame):
         """Handle tokenizer selection change"""
         selected_display = self.selected_tokenizer.get()
         
-        selected_tokenizer = None
-        for tokenizer in self.tokenizer_options:
-            if tokenizer['display_name'] == selected_display or f"🔒 {tokenizer['display_name']}" == selected_display:
-                selected_tokenizer = tokenizer
-                break
+        selected_tokenizer = self._tok_by_display.get(selected_display)
         
         if not selected_tokenizer:
             return
         
         if not selected_tokenizer['has_access']:
             self.show_premium_upgrade_dialog(selected_tokenizer['name'])
-            self.update_tokenizer_dropdown()
+            # Revert the selection; the tokenizer list itself hasn't changed
+            self.selected_tokenizer.set(self._previous_display)
             return
         
         self._current_tokenizer_name = selected_tokenizer['name']
+        self._previous_display = selected_display
         
         if self.chunks:
             self.update_chunk_analysis()
@@ -468,13 +546,46 @@ class AppFrame(Frame):
         if not self.chunks:
             return
         
+        tokenizer_name = self._current_tokenizer_name
+        chunks = self.chunks
+        future = self._run_in_background(self.controller.analyze_chunks, chunks, tokenizer_name, TOKEN_LIMIT)
+        future.add_done_callback(
+            lambda f: self._call_on_ui(self._on_chunk_analysis, f, chunks, tokenizer_name)
+        )
+
+    def _run_in_background(self, fn, *args):
+        """Run fn(*args) on a daemon thread so closing the app never waits for it; returns its Future"""
+        future = Future()
+        
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _call_on_ui(self, callback, *args):
+        """Worker thread: schedule callback on the Tk thread unless the window is gone"""
+        try:
+            if self.winfo_exists():
+                self.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # App closed while the worker was running
+
+    def _on_chunk_analysis(self, future, chunks, tokenizer_name):
+        """UI thread: apply a finished chunk analysis unless it has been superseded"""
+        if chunks is not self.chunks or tokenizer_name != self._current_tokenizer_name:
+            return
+        
         try:
-            tokenizer_name = getattr(self, '_current_tokenizer_name', 'gpt2')
-            self.current_analysis = self.controller.analyze_chunks(self.chunks, tokenizer_name, TOKEN_LIMIT)
+            self.current_analysis = future.result()
             
             if self.controller.license_manager.check_feature_access('advanced_analytics'):
-                tokenizer_info = next((t for t in self.controller.get_available_tokenizers() 
-                                     if t['name'] == tokenizer_name), None)
+                tokenizer_info = self._tok_by_name.get(tokenizer_name)
                 
                 if tokenizer_info and self.current_analysis:
                     enhanced_recommendations = list(self.current_analysis.get('recommendations', []))
@@ -509,7 +620,7 @@ class AppFrame(Frame):
         if path:
             self.file_path = path
             # Enhanced file label with format detection
-            filename = os.path.basename(path)
+            filename = self._file_basename = os.path.basename(path)
             file_ext = os.path.splitext(path)[1].lower()
             format_emoji = {
                 '.txt': '📄',
@@ -523,6 +634,7 @@ class AppFrame(Frame):
             self.chunks = []
             self.current_analysis = None
             self.session.add_file(path)
+            self._mark_session_changed()
 
     # Updated handle_file_drop() function
     # Replace the existing handle_file_drop() function with this version:
@@ -530,13 +642,13 @@ class AppFrame(Frame):
     def handle_file_drop(self, event):
         """Handle drag and drop file - now supports CSV"""
         path = event.data.strip("{}")
-        supported_extensions = (".txt", ".pdf", ".epub", ".docx", ".csv")
+        file_ext = os.path.splitext(path)[1].lower()
         
-        if os.path.isfile(path) and path.lower().endswith(supported_extensions):
+        # Cheap extension check first; only stat the path for supported types
+        if file_ext in ALLOWED_EXTS and os.path.isfile(path):
             self.file_path = path
             # Enhanced file label with format detection
-            filename = os.path.basename(path)
-            file_ext = os.path.splitext(path)[1].lower()
+            filename = self._file_basename = os.path.basename(path)
             format_emoji = {
                 '.txt': '📄',
                 '.pdf': '📕', 
@@ -549,6 +661,7 @@ class AppFrame(Frame):
             self.chunks = []
             self.current_analysis = None
             self.session.add_file(path)
+            self._mark_session_changed()
         else:
             messagebox.showerror(
                 "Invalid File", 
@@ -569,102 +682,79 @@ class AppFrame(Frame):
             messagebox.showerror("Missing File", "Please select a file first.")
             return
 
+        # One file at a time; the process button is disabled until the current run finishes
+        if self._process_future is not None and not self._process_future.done():
+            return
+
         method = self.split_method.get()
         delimiter = self.delimiter_entry.get() if method == "custom" else None
-        tokenizer_name = getattr(self, '_current_tokenizer_name', 'gpt2')
-
-        try:
-            clean_opts = {
-                "remove_headers": True, 
-                "normalize_whitespace": True, 
-                "strip_bullets": True
-            }
-            
-            # Show processing message for DOCX files (they can be slow)
-            file_ext = os.path.splitext(self.file_path)[1].lower()
-            processing_window = None
-            
-            if file_ext == '.docx':
-                # Create a simple processing dialog
-                processing_window = tk.Toplevel(self)
-                processing_window.title("Processing...")
-                processing_window.geometry("300x100")
-                processing_window.resizable(False, False)
-                
-                # Center the window
-                processing_window.transient(self)
-                processing_window.grab_set()
-                
-                Label(processing_window, 
-                      text="🔄 Processing Word document...\nThis may take a moment.",
-                      style="Secondary.TLabel").pack(expand=True)
-                
-                # Update the display
-                processing_window.update()
+        tokenizer_name = self._current_tokenizer_name
+        file_path = self.file_path
+
+        clean_opts = {
+            "remove_headers": True, 
+            "normalize_whitespace": True, 
+            "strip_bullets": True
+        }
+        
+        # Show processing message for DOCX files (they can be slow)
+        file_ext = os.path.splitext(file_path)[1].lower()
+        processing_window = None
+        
+        if file_ext == '.docx':
+            # Create a simple processing dialog
+            processing_window = tk.Toplevel(self)
+            processing_window.title("Processing...")
+            processing_window.geometry("300x100")
+            processing_window.resizable(False, False)
             
-            self.chunks = self.controller.process_book(
-                self.file_path, clean_opts, method, delimiter, tokenizer_name
-            )
-            self.current_analysis = self.controller.analyze_chunks(
-                self.chunks, tokenizer_name, TOKEN_LIMIT
-            )
+            # Center the window
+            processing_window.transient(self)
+            processing_window.grab_set()
             
-            # Close processing dialog if it exists
-            if processing_window:
+            Label(processing_window, 
+                  text="🔄 Processing Word document...\nThis may take a moment.",
+                  style="Secondary.TLabel").pack(expand=True)
+        
+        if self.process_button:
+            self.process_button.config(state="disabled")
+        
+        # Parsing and tokenization run on a worker; widgets are only touched in _on_processed
+        future = self._process_future = self._run_in_background(
+            self._process_file, file_path, clean_opts, method, delimiter, tokenizer_name
+        )
+        future.add_done_callback(
+            lambda f: self._call_on_ui(self._on_processed, f, file_path, file_ext, tokenizer_name, processing_window)
+        )
+
+    def _process_file(self, file_path, clean_opts, method, delimiter, tokenizer_name):
+        """Worker thread: split the file into chunks and analyze them"""
+        chunks = self.controller.process_book(
+            file_path, clean_opts, method, delimiter, tokenizer_name
+        )
+        analysis = self.controller.analyze_chunks(chunks, tokenizer_name, TOKEN_LIMIT)
+        return chunks, analysis
+
+    def _on_processed(self, future, file_path, file_ext, tokenizer_name, processing_window):
+        """UI thread: store processing results and report them"""
+        # Close processing dialog if it exists
+        if processing_window:
+            try:
                 processing_window.destroy()
-                processing_window = None
-            
-            # Update session
-            for f in self.session.files:
-                if f.path == self.file_path:
-                    f.chunks = self.chunks
-                    f.config['tokenizer'] = tokenizer_name
-                    break
-
-            # Create enhanced success message with format-specific info
-            analysis = self.current_analysis
-            format_name = {
-                '.txt': 'text file',
-                '.pdf': 'PDF document', 
-                '.epub': 'EPUB book',
-                '.docx': 'Word document'
-            }.get(file_ext, 'document')
-            
-            msg = f"✅ Processed {format_name} into {analysis['total_chunks']} chunks using {tokenizer_name}\n"
-            msg += f"📊 Total tokens: {analysis['total_tokens']:,} | Average: {analysis['avg_tokens']}\n"
-            
-            if analysis['over_limit'] > 0:
-                msg += f"⚠️ {analysis['over_limit']} chunks exceed {TOKEN_LIMIT} tokens ({analysis['over_limit_percentage']:.1f}%)"
-            else:
-                msg += "✨ All chunks within token limit!"
-                
-            if analysis.get('advanced_analytics'):
-                msg += f"\n🎯 Efficiency Score: {analysis['efficiency_score']}%"
-                if analysis.get('cost_estimates'):
-                    cost = analysis['cost_estimates']['estimated_api_cost']
-                    msg += f"\n💰 Estimated training cost: ${cost:.4f}"
-            
-            # Add format-specific tips
-            if file_ext == '.docx':
-                msg += f"\n\n💡 Word document processing included:"
-                msg += f"\n• Paragraphs and headings"
-                msg += f"\n• Table content" 
-                msg += f"\n• Headers and footers"
-            
-            # Add cost analysis prompt for premium users
-            if self.controller.license_manager.check_feature_access('advanced_cost_analysis'):
-                msg += f"\n\n💡 Click 'Analyze Training Costs' for comprehensive cost analysis across 15+ approaches!"
-            
-            messagebox.showinfo("Processing Complete", msg)
-            
+            except tk.TclError:
+                pass
+        
+        if self.process_button:
+            self.process_button.config(state="normal")
+        
+        try:
+            chunks, analysis = future.result()
         except Exception as e:
-            # Close processing dialog if it exists and there's an error
-            if processing_window:
-                try:
-                    processing_window.destroy()
-                except:
-                    pass
-                
+            # A newer file selection replaced this run; don't interrupt with its failure
+            if file_path != self.file_path:
+                logging.warning(f"Processing of {file_path} failed after another file was selected: {e}")
+                return
+            
             # Enhanced error handling for DOCX-specific issues
             error_msg = str(e)
             if file_ext == '.docx':
@@ -678,6 +768,67 @@ class AppFrame(Frame):
                     error_msg = f"❌ Could not process Word document:\n\n{error_msg}"
             
             messagebox.showerror("Processing Error", error_msg)
+            return
+        
+        # Update session
+        for f in self.session.files:
+            if f.path == file_path:
+                f.chunks = chunks
+                f.config['tokenizer'] = tokenizer_name
+                break
+        self._mark_session_changed()
+
+        # Another file was selected while this one was processing; keep its results
+        if file_path != self.file_path:
+            return
+        self.chunks, self.current_analysis = chunks, analysis
+
+        # Create enhanced success message with format-specific info
+        format_name = {
+            '.txt': 'text file',
+            '.pdf': 'PDF document', 
+            '.epub': 'EPUB book',
+            '.docx': 'Word document'
+        }.get(file_ext, 'document')
+        
+        msg = f"✅ Processed {format_name} into {analysis['total_chunks']} chunks using {tokenizer_name}\n"
+        msg += f"📊 Total tokens: {analysis['total_tokens']:,} | Average: {analysis['avg_tokens']}\n"
+        
+        if analysis['over_limit'] > 0:
+            msg += f"⚠️ {analysis['over_limit']} chunks exceed {TOKEN_LIMIT} tokens ({analysis['over_limit_percentage']:.1f}%)"
+        else:
+            msg += "✨ All chunks within token limit!"
+            
+        if analysis.get('advanced_analytics'):
+            msg += f"\n🎯 Efficiency Score: {analysis['efficiency_score']}%"
+            if analysis.get('cost_estimates'):
+                cost = analysis['cost_estimates']['estimated_api_cost']
+                msg += f"\n💰 Estimated training cost: ${cost:.4f}"
+        
+        # Add format-specific tips
+        if file_ext == '.docx':
+            msg += f"\n\n💡 Word document processing included:"
+            msg += f"\n• Paragraphs and headings"
+            msg += f"\n• Table content" 
+            msg += f"\n• Headers and footers"
+        
+        # Add cost analysis prompt for premium users
+        if self.controller.license_manager.check_feature_access('advanced_cost_analysis'):
+            msg += f"\n\n💡 Click 'Analyze Training Costs' for comprehensive cost analysis across 15+ approaches!"
+        
+        messagebox.showinfo("Processing Complete", msg)
+
+    def _flash_status(self, msg, level="info"):
+        """Show a message in the status bar and clear it after a few seconds"""
+        if self._status_after is not None:
+            self.after_cancel(self._status_after)
+        self.status_label.config(text=msg, foreground=STATUS_COLORS.get(level, STATUS_COLORS["info"]))
+        self._status_after = self.after(STATUS_FLASH_MS, self._clear_status)
+
+    def _clear_status(self):
+        """Clear the status bar message"""
+        self._status_after = None
+        self.status_label.config(text="")
 
     # Export operations
     def export_csv(self):
@@ -688,7 +839,7 @@ class AppFrame(Frame):
         path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV File", "*.csv")])
         if path:
             save_as_csv(self.chunks, path)
-            messagebox.showinfo("✅ Export Complete", f"Dataset saved to {path}")
+            self._flash_status(f"✅ Dataset saved to {path}", "success")
 
     def export_txt(self):
         """Export chunks as TXT file"""
@@ -698,32 +849,54 @@ class AppFrame(Frame):
         path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text File", "*.txt")])
         if path:
             save_as_txt(self.chunks, path)
-            messagebox.showinfo("✅ Export Complete", f"Dataset saved to {path}")
+            self._flash_status(f"✅ Dataset saved to {path}", "success")
 
     # Session operations with enhanced feedback
-    def save_session(self):
+    def _mark_session_changed(self):
+        """Invalidate the cached session file JSON after files or chunks change"""
+        self._session_version += 1
+
+    def _get_session_files_json(self, pretty=False):
+        """Serialized session files, rebuilt only when the session or format has changed"""
+        cache = self._session_cache
+        if cache is None or cache[0] != self._session_version or cache[1] != pretty:
+            if pretty:
+                files_json = json.dumps(self.session.to_dict()['files'], **SESSION_JSON_PRETTY)
+                # Pre-indent for nesting under the top-level "files" key
+                files_json = files_json.replace("\n", "\n  ")
+            else:
+                files_json = json.dumps(self.session.to_dict()['files'], **SESSION_JSON_COMPACT)
+            self._session_cache = (self._session_version, pretty, files_json)
+        return self._session_cache[2]
+
+    def save_session(self, pretty=False):
         """Enhanced session saving with comprehensive preferences"""
         path = filedialog.asksaveasfilename(defaultextension=".wsession", 
                                           filetypes=[("Wolfscribe Session", "*.wsession")])
         if not path:
             return
         try:
-            session_data = self.session.to_dict()
-            
             # Enhanced session data with UI preferences
-            session_data['ui_preferences'] = {
-                'selected_tokenizer': getattr(self, '_current_tokenizer_name', 'gpt2'),
-                'split_method': self.split_method.get(),
-                'token_limit': TOKEN_LIMIT,
-                'theme': 'modern_slate'
-            }
+            session_data = {}
+            session_data['ui_preferences'] = UIPreferences(
+                selected_tokenizer=self._current_tokenizer_name,
+                split_method=self.split_method.get(),
+                token_limit=TOKEN_LIMIT
+            ).to_dict()
             
             if self.current_analysis:
                 session_data['last_analysis'] = self.current_analysis
                 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
-            messagebox.showinfo("💾 Session Saved", f"Session saved successfully to:\n{path}")
+            # Splice the cached files JSON in front of the small, per-save fields
+            if pretty:
+                extras_json = json.dumps(session_data, **SESSION_JSON_PRETTY)
+                head = '{\n  "files": '
+            else:
+                extras_json = json.dumps(session_data, **SESSION_JSON_COMPACT)
+                head = '{"files":'
+            with open(path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+                f.write(head + self._get_session_files_json(pretty) + ',' + extras_json[1:])
+            self._flash_status(f"💾 Session saved to {path}", "success")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save session: {str(e)}")
 
@@ -737,22 +910,22 @@ class AppFrame(Frame):
                 data = json.load(f)
             
             self.session = Session.from_dict(data)
+            self._mark_session_changed()
             
             # Restore UI preferences
-            ui_prefs = data.get('ui_preferences', {})
-            if ui_prefs:
-                preferred_tokenizer = ui_prefs.get('selected_tokenizer', 'gpt2')
+            if data.get('ui_preferences'):
+                ui_prefs = UIPreferences.from_dict(data['ui_preferences'])
+                preferred_tokenizer = ui_prefs.selected_tokenizer
                 if self.controller.license_manager.check_tokenizer_access(preferred_tokenizer):
                     self._current_tokenizer_name = preferred_tokenizer
                     self.update_tokenizer_dropdown()
                     
-                    for tokenizer in self.tokenizer_options:
-                        if tokenizer['name'] == preferred_tokenizer:
-                            self.selected_tokenizer.set(tokenizer['display_name'])
-                            break
+                    tokenizer = self._tok_by_name.get(preferred_tokenizer)
+                    if tokenizer:
+                        self.selected_tokenizer.set(tokenizer['display_name'])
+                        self._previous_display = tokenizer['display_name']
                 
-                split_method = ui_prefs.get('split_method', 'paragraph')
-                self.split_method.set(split_method)
+                self.split_method.set(ui_prefs.split_method)
                 self.on_split_method_change()
             
             self.current_analysis = data.get('last_analysis')
@@ -762,7 +935,7 @@ class AppFrame(Frame):
                 first_file = self.session.files[0]
                 self.file_path = first_file.path
                 # Enhanced file label with format detection for restored files
-                filename = os.path.basename(self.file_path)
+                filename = self._file_basename = os.path.basename(self.file_path)
                 file_ext = os.path.splitext(self.file_path)[1].lower()
                 format_emoji = {
                     '.txt': '📄',
@@ -777,13 +950,8 @@ class AppFrame(Frame):
                 if self.chunks:
                     self.update_chunk_analysis()
             
-            # Refresh scroll bindings after loading session
-            self.refresh_mousewheel_bindings()
-            
-            messagebox.showinfo("📂 Session Loaded", 
-                f"Session loaded successfully from:\n{path}\n\n"
-                f"Files: {len(self.session.files)}\n"
-                f"Chunks: {len(self.chunks)}")
+            self._flash_status(f"📂 Session loaded from {path} - "
+                               f"{len(self.session.files)} files, {len(self.chunks)} chunks", "success")
             
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load session: {str(e)}")
\ No newline at end of file
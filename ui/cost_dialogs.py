@@ -1,21 +1,89 @@
 # ui/cost_dialogs.py
-import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from ttkbootstrap import Frame, Label, Button, Entry, Combobox, Radiobutton, Checkbutton
+from ttkbootstrap import Frame, Label, Button, Entry, Combobox, Radiobutton, Checkbutton, Treeview
 from ttkbootstrap.constants import *
+from collections import OrderedDict
+import hashlib
+import json
+import queue
 import threading
 import time
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
 from ui.styles import MODERN_SLATE
 
+COST_CACHE_TTL = 300  # seconds a cached cost analysis stays valid
+COST_CACHE_MAX = 32  # cached analyses kept before the least recently used is dropped
+
+# Executive summary layout: (group, heading, heading style, ((text template, style, font), ...));
+# templates are filled with format_map from the context built in _fill_cost_summary
+SUMMARY_COLUMNS = (
+    ("best", "🏆 Best Training Option", "Success.TLabel", (
+        ("Approach: {approach}", "Secondary.TLabel", ("Segoe UI", 11, "bold")),
+        ("Cost: ${cost:.2f}", "Secondary.TLabel", ("Segoe UI", 11)),
+        ("Time: {hours:.1f} hours", "Secondary.TLabel", ("Segoe UI", 11)),
+    )),
+    ("range", "💰 Cost Analysis", "Primary.TLabel", (
+        ("Range: ${min:.2f} - ${max:.2f}", "Secondary.TLabel", ("Segoe UI", 11)),
+        ("Max Savings: ${savings:.2f}", "CostSavings.TLabel", ("Segoe UI", 11)),
+        ("Models Compared: {models_compared}", "Secondary.TLabel", ("Segoe UI", 11)),
+    )),
+    ("roi", "📈 ROI Overview", "Premium.TLabel", (
+        ("Break-even: {break_even:.1f} months", "Secondary.TLabel", ("Segoe UI", 11)),
+        ("Annual ROI: ${annual_savings:.0f}", "CostSavings.TLabel", ("Segoe UI", 11)),
+        ("Payback: {payback_days:.0f} days", "Secondary.TLabel", ("Segoe UI", 11)),
+    )),
+)
+
+
+# Approaches table columns: (key, header, width in characters)
+APPROACH_COLUMNS = (
+    ("rank", "Rank", 6), ("model", "Model", 15), ("approach", "Training Approach", 20),
+    ("cost", "Cost (USD)", 12), ("time", "Time (Hours)", 12), ("hardware", "Hardware", 15),
+    ("confidence", "Confidence", 10),
+)
+
+
+_by_cost = itemgetter('cost')
+
+
+def _truncate(text, limit):
+    """Shorten text to limit characters plus an ellipsis for table cells"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def wheel_events(widget):
+    """Event sequences that carry mouse wheel scrolling on this windowing system"""
+    if widget.tk.call("tk", "windowingsystem") == "x11":
+        # Linux scroll up/down arrive as buttons 4 and 5
+        return ("<MouseWheel>", "<Button-4>", "<Button-5>")
+    return ("<MouseWheel>",)  # Windows/Mac
+
+
 class CostAnalysisDialogs:
     """Handles all cost analysis related dialogs and exports"""
     
     def __init__(self, parent, controller):
         self.parent = parent
         self.controller = controller
-        self.cost_analysis_cache = {}
+        self.cost_analysis_cache = OrderedDict()  # cache key -> {'data', 'timestamp'}, LRU order
+        self._chunks_digest = None  # (chunks list, content digest) for the analysis cache key
+        self._cost_q = queue.Queue()  # (kind, payload) messages from the analysis worker
+        self._cost_thread = None  # daemon thread running the current analysis
+        self._tokenizer_name = 'gpt2'  # tokenizer the displayed analysis was run with
+        
+        # Cost analysis window, built once and refilled for each analysis
+        self._cost_dialog = None
+        self._cost_detach = None  # unbinds the wheel and cancels pending callbacks of _cost_dialog
+        self._cost_canvas = None
+        self._cost_summary_frame = None
+        self._cost_body = None
+        self._cost_labels = {}
+        self._cost_groups = {}
+        self._cost_export_btn = None
+        self._approaches_cache = None  # (cost analysis, its approaches sorted by cost)
         
     def show_cost_analysis(self):
         """STAGE 3 ENHANCED: Main cost analysis method with loading states and caching"""
@@ -28,8 +96,12 @@ class CostAnalysisDialogs:
             self.show_cost_upgrade_dialog()
             return
 
+        # Only one analysis at a time; repeated clicks while it runs are ignored
+        if self._cost_thread is not None and self._cost_thread.is_alive():
+            return
+
         try:
-            tokenizer_name = getattr(self.parent, '_current_tokenizer_name', 'gpt2')
+            tokenizer_name = self._tokenizer_name = self.parent._current_tokenizer_name
             target_models = ['llama-2-7b', 'llama-2-13b', 'claude-3-haiku']
             api_usage_monthly = 100000
             
@@ -45,67 +117,33 @@ class CostAnalysisDialogs:
                 return
             
             # Show loading dialog
+            # Stages reported by the controller: token count, one per model, recommendations
             loading_window, progress, status_label = self._show_loading_dialog(
                 "Analyzing Training Costs",
-                "Calculating comprehensive costs across 15+ approaches...\nThis may take a few seconds."
+                "Calculating comprehensive costs across 15+ approaches...\nThis may take a few seconds.",
+                steps=len(target_models) + 2
             )
             
             def run_analysis():
+                # Worker thread: only talks to the UI through the queue
                 try:
-                    # Update status
-                    def update_status(text):
-                        try:
-                            status_label.config(text=text)
-                            loading_window.update()
-                        except tk.TclError:
-                            pass
-                    
-                    update_status("Loading model database...")
-                    time.sleep(0.5)  # Brief pause for UI feedback
-                    
-                    update_status("Fetching real-time cloud pricing...")
-                    time.sleep(0.5)
-                    
-                    update_status("Calculating training costs...")
-                    
-                    # Perform the actual analysis
                     cost_analysis = self.controller.analyze_chunks_with_costs(
                         self.parent.chunks, 
                         tokenizer_name, 
                         512,
                         target_models=target_models,
-                        api_usage_monthly=api_usage_monthly
+                        api_usage_monthly=api_usage_monthly,
+                        progress_cb=lambda text: self._cost_q.put(("status", text))
                     )
-                    
-                    update_status("Generating optimization recommendations...")
-                    time.sleep(0.3)
-                    
-                    # Cache the results
-                    self.cost_analysis_cache[cache_key] = {
-                        'data': cost_analysis,
-                        'timestamp': time.time()
-                    }
-                    
-                    # Close loading dialog and show results
-                    self._close_loading_dialog(loading_window, progress)
-                    self._display_cost_analysis_dialog(cost_analysis)
-                    
+                    self._cost_q.put(("done", cost_analysis))
                 except Exception as e:
-                    self._close_loading_dialog(loading_window, progress)
-                    self._show_enhanced_error_dialog(
-                        "Cost Analysis Error",
-                        f"Failed to analyze training costs: {str(e)}",
-                        recovery_suggestions=[
-                            "Check your internet connection for live pricing",
-                            "Try with a smaller dataset",
-                            "Contact support if the problem persists"
-                        ]
-                    )
+                    self._cost_q.put(("error", e))
             
             # Run analysis in thread to keep UI responsive
-            analysis_thread = threading.Thread(target=run_analysis)
-            analysis_thread.daemon = True
-            analysis_thread.start()
+            self._cost_thread = threading.Thread(target=run_analysis)
+            self._cost_thread.daemon = True
+            self._cost_thread.start()
+            self.parent.after(50, self._drain_cost_queue, cache_key, loading_window, progress, status_label)
             
         except Exception as e:
             self._show_enhanced_error_dialog(
@@ -113,6 +151,43 @@ class CostAnalysisDialogs:
                 f"Failed to start cost analysis: {str(e)}"
             )
 
+    def _drain_cost_queue(self, cache_key, loading_window, progress, status_label):
+        """Apply queued analysis messages on the Tk thread, polling until the worker finishes"""
+        while True:
+            try:
+                kind, payload = self._cost_q.get_nowait()
+            except queue.Empty:
+                self.parent.after(50, self._drain_cost_queue, cache_key, loading_window, progress, status_label)
+                return
+            
+            if kind == "status":
+                try:
+                    status_label.config(text=payload)
+                    # step() would wrap to 0 on the last stage; clamp at maximum instead
+                    progress['value'] = min(float(progress['value']) + 1, float(progress['maximum']))
+                except tk.TclError:
+                    pass
+            elif kind == "done":
+                # Cache the results
+                self._store_analysis(cache_key, payload)
+                
+                # Close loading dialog and show results
+                self._close_loading_dialog(loading_window, progress)
+                self._display_cost_analysis_dialog(payload)
+                return
+            else:
+                self._close_loading_dialog(loading_window, progress)
+                self._show_enhanced_error_dialog(
+                    "Cost Analysis Error",
+                    f"Failed to analyze training costs: {str(payload)}",
+                    recovery_suggestions=[
+                        "Check your internet connection for live pricing",
+                        "Try with a smaller dataset",
+                        "Contact support if the problem persists"
+                    ]
+                )
+                return
+
     def show_cost_upgrade_dialog(self):
         """Show upgrade dialog for cost analysis feature"""
         try:
@@ -153,7 +228,7 @@ Would you like to start your free trial?"""
         dialog.configure(bg=MODERN_SLATE['bg_primary'])
         
         # Center the dialog
-        dialog.geometry(f"+{dialog.winfo_screenwidth()//2 - width//2}+{dialog.winfo_screenheight()//2 - height//2}")
+        dialog.geometry(f"+{self.parent._scr_w//2 - width//2}+{self.parent._scr_h//2 - height//2}")
         
         # Create canvas and scrollbar for dialog
         dialog_canvas = tk.Canvas(dialog, 
@@ -165,10 +240,21 @@ Would you like to start your free trial?"""
         # Create content frame
         content_frame = Frame(dialog_canvas, padding=(20, 20), style="Modern.TFrame")
         
-        content_frame.bind(
-            "<Configure>",
-            lambda e: dialog_canvas.configure(scrollregion=dialog_canvas.bbox("all"))
-        )
+        # Every child pack fires <Configure>; measure the canvas once per idle pass
+        scrollregion = {"pending": None}
+        
+        def update_scrollregion():
+            scrollregion["pending"] = None
+            try:
+                dialog_canvas.configure(scrollregion=dialog_canvas.bbox("all"))
+            except tk.TclError:
+                pass  # Dialog might be destroyed
+        
+        def schedule_scrollregion(event):
+            if scrollregion["pending"] is None:
+                scrollregion["pending"] = dialog.after_idle(update_scrollregion)
+        
+        content_frame.bind("<Configure>", schedule_scrollregion)
         
         dialog_canvas.create_window((0, 0), window=content_frame, anchor="nw")
         dialog_canvas.configure(yscrollcommand=dialog_scrollbar.set)
@@ -178,34 +264,81 @@ Would you like to start your free trial?"""
         dialog_scrollbar.pack(side="right", fill="y")
         
         # FIXED: Dialog-specific mousewheel binding (not global)
-        def dialog_mousewheel(event):
+        # Wheel steps are accumulated and applied in one yview_scroll per burst
+        scroll = {"delta": 0, "pending": None}
+        
+        def flush_scroll():
+            scroll["pending"] = None
+            delta, scroll["delta"] = scroll["delta"], 0
             try:
-                dialog_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                if delta:
+                    dialog_canvas.yview_scroll(delta, "units")
             except tk.TclError:
                 pass  # Dialog might be destroyed
-                
-        dialog_canvas.bind("<MouseWheel>", dialog_mousewheel)
-        content_frame.bind("<MouseWheel>", dialog_mousewheel)
-        dialog_canvas.bind("<Button-4>", lambda e: dialog_canvas.yview_scroll(-1, "units"))
-        dialog_canvas.bind("<Button-5>", lambda e: dialog_canvas.yview_scroll(1, "units"))
+        
+        def dialog_mousewheel(event):
+            if event.num == 4:
+                scroll["delta"] -= 1
+            elif event.num == 5:
+                scroll["delta"] += 1
+            else:
+                scroll["delta"] += int(-1 * (event.delta / 120))
+            if scroll["pending"] is None:
+                scroll["pending"] = dialog.after(10, flush_scroll)
+        
+        unbind_wheel = self._bind_wheel(dialog_canvas, dialog_mousewheel)
+        
+        # Drop the global wheel binding and pending callbacks; used when hiding or destroying
+        def detach_dialog():
+            try:
+                for state in (scroll, scrollregion):
+                    if state["pending"] is not None:
+                        dialog.after_cancel(state["pending"])
+                        state["pending"] = None
+                scroll["delta"] = 0
+                unbind_wheel()
+            except tk.TclError:
+                pass
         
         # FIXED: Cleanup binding when dialog is destroyed
         def cleanup_dialog():
+            detach_dialog()
             try:
-                dialog_canvas.unbind("<MouseWheel>")
-                content_frame.unbind("<MouseWheel>")
-                dialog_canvas.unbind("<Button-4>")
-                dialog_canvas.unbind("<Button-5>")
                 dialog.destroy()
             except tk.TclError:
                 pass
         
         dialog.protocol("WM_DELETE_WINDOW", cleanup_dialog)
         
-        return dialog, content_frame, cleanup_dialog
+        return dialog, content_frame, detach_dialog, cleanup_dialog
 
-    def _show_loading_dialog(self, title="Processing", message="Please wait..."):
-        """FIXED: Loading dialog with proper cleanup"""
+    @staticmethod
+    def _bind_wheel(widget, on_wheel):
+        """Route wheel events to on_wheel only while the pointer is over widget; returns the unbinder"""
+        sequences = wheel_events(widget)
+        
+        def bind(event=None):
+            for sequence in sequences:
+                widget.bind_all(sequence, on_wheel)
+        
+        def unbind(event=None):
+            for sequence in sequences:
+                widget.unbind_all(sequence)
+        
+        def leave(event):
+            # Moving onto a child widget also sends <Leave>; only unbind outside the widget area
+            x, y = widget.winfo_pointerxy()
+            left, top = widget.winfo_rootx(), widget.winfo_rooty()
+            if left <= x < left + widget.winfo_width() and top <= y < top + widget.winfo_height():
+                return
+            unbind()
+        
+        widget.bind("<Enter>", bind)
+        widget.bind("<Leave>", leave)
+        return unbind
+
+    def _show_loading_dialog(self, title="Processing", message="Please wait...", steps=None):
+        """FIXED: Loading dialog with proper cleanup; with steps, the bar advances per status update"""
         loading_window = tk.Toplevel(self.parent)
         loading_window.title(title)
         loading_window.geometry("400x150")
@@ -215,8 +348,8 @@ Would you like to start your free trial?"""
         
         # Center the window
         loading_window.geometry("+%d+%d" % (
-            loading_window.winfo_screenwidth()//2 - 200,
-            loading_window.winfo_screenheight()//2 - 75
+            self.parent._scr_w//2 - 200,
+            self.parent._scr_h//2 - 75
         ))
         
         # Create content frame with modern styling
@@ -231,11 +364,19 @@ Would you like to start your free trial?"""
         
         # Progress bar with modern styling
         from tkinter import ttk
-        progress = ttk.Progressbar(content_frame, 
-                                  mode='indeterminate',
-                                  style="Modern.Horizontal.TProgressbar")
-        progress.pack(fill=X, pady=(0, 10))
-        progress.start(10)
+        if steps:
+            # Real progress: one step per stage the worker reports, no animation loop
+            progress = ttk.Progressbar(content_frame, 
+                                      mode='determinate',
+                                      maximum=steps,
+                                      style="Modern.Horizontal.TProgressbar")
+            progress.pack(fill=X, pady=(0, 10))
+        else:
+            progress = ttk.Progressbar(content_frame, 
+                                      mode='indeterminate',
+                                      style="Modern.Horizontal.TProgressbar")
+            progress.pack(fill=X, pady=(0, 10))
+            progress.start(50)  # same cadence as the result queue poll
         
         # Status label
         status_label = Label(content_frame, text="Analyzing training approaches...", 
@@ -243,7 +384,7 @@ Would you like to start your free trial?"""
                             font=("Segoe UI", 9))
         status_label.pack()
         
-        loading_window.update()
+        # No update() here: the dialog paints on the next idle pass once the caller returns
         return loading_window, progress, status_label
 
     def _close_loading_dialog(self, loading_window, progress):
@@ -257,14 +398,18 @@ Would you like to start your free trial?"""
 
     def _get_analysis_cache_key(self, chunks, tokenizer_name, token_limit, target_models, api_usage):
         """Generate cache key for cost analysis results"""
-        import hashlib
-        
-        # Create a hash of the analysis parameters
-        chunks_hash = hashlib.md5(str(len(chunks)).encode() + 
-                                 (chunks[0][:100] if chunks else "").encode()).hexdigest()[:8]
+        # Digest the full content once per chunk list; AppFrame replaces the list
+        # on every load/process rather than mutating it, so identity marks staleness
+        if self._chunks_digest is None or self._chunks_digest[0] is not chunks:
+            h = hashlib.blake2b(digest_size=16)
+            for chunk in chunks:
+                h.update(chunk.encode("utf-8", "ignore"))
+                h.update(b"\0")
+            self._chunks_digest = (chunks, h.hexdigest())
+        chunks_hash = self._chunks_digest[1]
         
         params_str = f"{chunks_hash}_{tokenizer_name}_{token_limit}_{len(target_models)}_{api_usage}"
-        return hashlib.md5(params_str.encode()).hexdigest()[:16]
+        return hashlib.blake2b(params_str.encode(), digest_size=8).hexdigest()
 
     def _is_analysis_cache_valid(self, cache_key):
         """Check if cached analysis is still valid (within 5 minutes)"""
@@ -272,7 +417,25 @@ Would you like to start your free trial?"""
             return False
         
         cache_time = self.cost_analysis_cache[cache_key].get('timestamp', 0)
-        return (time.time() - cache_time) < 300  # 5 minutes
+        if (time.time() - cache_time) >= COST_CACHE_TTL:
+            return False
+        self.cost_analysis_cache.move_to_end(cache_key)
+        return True
+
+    def _store_analysis(self, cache_key, cost_analysis):
+        """Cache an analysis, dropping expired entries and the least recently used beyond the cap"""
+        now = time.time()
+        cache = self.cost_analysis_cache
+        for key in [k for k, entry in cache.items() if now - entry['timestamp'] >= COST_CACHE_TTL]:
+            del cache[key]
+        
+        cache[cache_key] = {
+            'data': cost_analysis,
+            'timestamp': now
+        }
+        cache.move_to_end(cache_key)
+        while len(cache) > COST_CACHE_MAX:
+            cache.popitem(last=False)
 
     def _show_enhanced_error_dialog(self, title, message, recovery_suggestions=None):
         """Show enhanced error dialog with recovery suggestions"""
@@ -299,17 +462,58 @@ Would you like to start your free trial?"""
             messagebox.showerror("Cost Analysis Error", f"Cost analysis failed: {error_msg}")
             return
 
-        # FIXED: Use the new scrollable dialog method
-        cost_window, content_frame, cleanup_dialog = self._create_scrollable_dialog(
-            "💰 Comprehensive Training Cost Analysis",
-            1100, 
-            800
-        )
+        # The dialog shell is built once; later analyses only refill it
+        if self._cost_dialog is None or not self._cost_dialog.winfo_exists():
+            self._build_cost_dialog()
+        else:
+            self._cost_dialog.deiconify()
+            self._cost_dialog.grab_set()
 
         # Extract cost analysis data
         cost_data = cost_analysis.get('cost_analysis', {})
         detailed_results = cost_data.get('detailed_results', {})
         summary = cost_data.get('summary', {})
+        labels = self._cost_labels
+        
+        dataset_info = cost_analysis.get('dataset_info', {})
+        labels['dataset'].config(
+            text=f"Dataset: {dataset_info.get('tokens', 0):,} tokens | "
+                 f"Chunks: {len(self.parent.chunks)} | "
+                 f"Tokenizer: {self._tokenizer_name}")
+
+        # Enhanced Summary Section with modern cards
+        if summary:
+            self._cost_summary_frame.pack(fill=X, pady=(0, 20), before=self._cost_body)
+            self._fill_cost_summary(summary)
+        else:
+            self._cost_summary_frame.pack_forget()
+
+        # Approaches table and recommendations vary in size, so they are rebuilt
+        body = self._cost_body
+        for child in body.winfo_children():
+            child.destroy()
+        
+        if detailed_results:
+            self._build_approaches_section(body, self._sorted_approaches(cost_analysis))
+        
+        recommendations = cost_data.get('recommendations', [])
+        if recommendations:
+            self._build_recommendations_section(body, recommendations)
+
+        self._cost_export_btn.configure(command=partial(self._export_cost_analysis, cost_analysis))
+        self._cost_canvas.yview_moveto(0)
+
+    def _build_cost_dialog(self):
+        """Create the cost analysis window and the widgets that are reused between analyses"""
+        # FIXED: Use the new scrollable dialog method
+        cost_window, content_frame, detach, _ = self._create_scrollable_dialog(
+            "💰 Comprehensive Training Cost Analysis",
+            1100, 
+            800
+        )
+        cost_window.protocol("WM_DELETE_WINDOW", self._hide_cost_dialog)
+        labels = {}
+        groups = {}
         
         # Header Section with modern styling
         header_frame = Frame(content_frame, style="Modern.TFrame", padding=(0, 0, 0, 20))
@@ -318,204 +522,215 @@ Would you like to start your free trial?"""
         Label(header_frame, text="💰 Comprehensive Training Cost Analysis", 
               style="Heading.TLabel", font=("Segoe UI", 18, "bold")).pack(anchor="w")
         
-        dataset_info = cost_analysis.get('dataset_info', {})
-        Label(header_frame, 
-              text=f"Dataset: {dataset_info.get('tokens', 0):,} tokens | "
-                   f"Chunks: {len(self.parent.chunks)} | "
-                   f"Tokenizer: {getattr(self.parent, '_current_tokenizer_name', 'gpt2')}", 
-              style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
+        labels['dataset'] = Label(header_frame, style="Secondary.TLabel", font=("Segoe UI", 11))
+        labels['dataset'].pack(anchor="w")
 
-        # Enhanced Summary Section with modern cards
-        if summary:
-            summary_frame = Frame(content_frame, style="Card.TFrame", padding=(20, 15))
-            summary_frame.pack(fill=X, pady=(0, 20))
-            
-            Label(summary_frame, text="📊 Executive Summary", 
-                  style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 10))
-            
-            # Create three-column layout for summary
-            summary_cols = Frame(summary_frame, style="Modern.TFrame")
-            summary_cols.pack(fill=X)
-            
-            # Column 1: Best Option
-            col1 = Frame(summary_cols, style="Modern.TFrame")
-            col1.pack(side=LEFT, fill=BOTH, expand=True, padx=(0, 10))
-            
-            Label(col1, text="🏆 Best Training Option", 
-                  style="Success.TLabel", font=("Segoe UI", 12, "bold")).pack(anchor="w")
-            
-            best_option = summary.get('best_overall', {})
-            if best_option:
-                Label(col1, text=f"Approach: {best_option.get('best_approach', 'N/A')}", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11, "bold")).pack(anchor="w")
-                Label(col1, text=f"Cost: ${best_option.get('cost', 0):.2f}", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-                Label(col1, text=f"Time: {best_option.get('hours', 0):.1f} hours", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-            
-            # Column 2: Cost Range
-            col2 = Frame(summary_cols, style="Modern.TFrame")
-            col2.pack(side=LEFT, fill=BOTH, expand=True, padx=(0, 10))
-            
-            Label(col2, text="💰 Cost Analysis", 
-                  style="Primary.TLabel", font=("Segoe UI", 12, "bold")).pack(anchor="w")
-            
-            cost_range = summary.get('cost_range', {})
-            if cost_range:
-                Label(col2, text=f"Range: ${cost_range.get('min', 0):.2f} - ${cost_range.get('max', 0):.2f}", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-                savings = cost_range.get('max', 0) - cost_range.get('min', 0)
-                Label(col2, text=f"Max Savings: ${savings:.2f}", 
-                      style="CostSavings.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-                Label(col2, text=f"Models Compared: {summary.get('models_compared', 0)}", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-            
-            # Column 3: ROI Quick Stats
-            col3 = Frame(summary_cols, style="Modern.TFrame")
-            col3.pack(side=LEFT, fill=BOTH, expand=True)
-            
-            Label(col3, text="📈 ROI Overview", 
-                  style="Premium.TLabel", font=("Segoe UI", 12, "bold")).pack(anchor="w")
-            
-            # Calculate simple ROI metrics from best option
-            if best_option:
-                monthly_api_cost = 100  # Estimated monthly API cost for comparison
-                monthly_savings = monthly_api_cost * 0.9  # 90% savings assumption
-                training_cost = best_option.get('cost', 0)
-                break_even = training_cost / monthly_savings if monthly_savings > 0 else float('inf')
-                
-                Label(col3, text=f"Break-even: {break_even:.1f} months", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-                annual_savings = (monthly_savings * 12) - training_cost
-                Label(col3, text=f"Annual ROI: ${annual_savings:.0f}", 
-                      style="CostSavings.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-                Label(col3, text=f"Payback: {break_even*30:.0f} days", 
-                      style="Secondary.TLabel", font=("Segoe UI", 11)).pack(anchor="w")
-
-        # Comprehensive Approaches Table with modern styling
-        if detailed_results:
-            approaches_frame = Frame(content_frame, style="Modern.TFrame")
-            approaches_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
-            
-            Label(approaches_frame, text="🔧 Complete Training Approaches Comparison", 
-                  style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 15))
-            
-            # Create enhanced comparison table with modern dark styling
-            table_container = Frame(approaches_frame, style="Card.TFrame")
-            table_container.pack(fill=BOTH, expand=True)
-            
-            # Enhanced table headers with modern styling
-            headers_frame = Frame(table_container, style="Card.TFrame", padding=(15, 10))
-            headers_frame.pack(fill=X)
-            
-            # Header labels with consistent styling
-            headers = [
-                ("Rank", 6), ("Model", 15), ("Training Approach", 20),
-                ("Cost (USD)", 12), ("Time (Hours)", 12), ("Hardware", 15), ("Confidence", 10)
-            ]
-            
-            for header, width in headers:
-                Label(headers_frame, text=header, 
-                      style="Secondary.TLabel", font=("Segoe UI", 10, "bold"), 
-                      width=width).pack(side=LEFT)
-            
-            # Collect and sort all approaches
-            all_approaches = []
-            for model_name, model_data in detailed_results.items():
-                if 'error' in model_data:
-                    continue
-                    
-                cost_estimates = model_data.get('cost_estimates', [])
-                for estimate in cost_estimates:
-                    # Extract hardware info
-                    hw_req = estimate.get('hardware_requirements', {})
-                    gpu_type = hw_req.get('gpu_type', 'Unknown')
-                    gpu_count = hw_req.get('gpu_count', 1)
-                    hardware_display = f"{gpu_type}" + (f" x{gpu_count}" if gpu_count > 1 else "")
-                    
-                    all_approaches.append({
-                        'model': model_name,
-                        'approach': estimate['approach_name'],
-                        'cost': estimate['total_cost_usd'],
-                        'hours': estimate['training_hours'],
-                        'hardware': hardware_display,
-                        'confidence': estimate.get('confidence', 0.8)
-                    })
-            
-            # Sort by cost (cheapest first)
-            all_approaches.sort(key=lambda x: x['cost'])
+        # Summary card; packed only when an analysis has a summary
+        summary_frame = Frame(content_frame, style="Card.TFrame", padding=(20, 15))
+        
+        Label(summary_frame, text="📊 Executive Summary", 
+              style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 10))
+        
+        # Create three-column layout for summary
+        summary_cols = Frame(summary_frame, style="Modern.TFrame")
+        summary_cols.pack(fill=X)
+        
+        # One column per summary group: a heading and its value labels
+        last = len(SUMMARY_COLUMNS) - 1
+        for index, (group, heading, heading_style, rows) in enumerate(SUMMARY_COLUMNS):
+            column = Frame(summary_cols, style="Modern.TFrame")
+            column.pack(side=LEFT, fill=BOTH, expand=True, padx=(0, 0 if index == last else 10))
             
-            # Display top 15 approaches with color coding
-            for i, approach in enumerate(all_approaches[:15]):
-                row_frame = Frame(table_container, style="Modern.TFrame", padding=(15, 8))
-                row_frame.pack(fill=X)
-                
-                # Rank with medal icons for top 3
-                rank_display = "🥇" if i == 0 else "🥈" if i == 1 else "🥉" if i == 2 else f"#{i+1}"
-                
-                # Color-coded styling based on cost efficiency
-                if i < 3:
-                    text_style = "Success.TLabel"  # Top 3 in green
-                elif approach['cost'] > all_approaches[0]['cost'] * 3:
-                    text_style = "Warning.TLabel"  # Expensive options in amber
-                else:
-                    text_style = "Secondary.TLabel"  # Normal options
-                
-                # Row data with proper truncation
-                row_data = [
-                    (rank_display, 6),
-                    (approach['model'][:12] + "..." if len(approach['model']) > 12 else approach['model'], 15),
-                    (approach['approach'][:18] + "..." if len(approach['approach']) > 18 else approach['approach'], 20),
-                    (f"${approach['cost']:.2f}", 12),
-                    (f"{approach['hours']:.1f}h", 12),
-                    (approach['hardware'][:12] + "..." if len(approach['hardware']) > 12 else approach['hardware'], 15),
-                    (f"{approach['confidence']*100:.0f}%", 10)
-                ]
-                
-                for data, width in row_data:
-                    font_weight = "bold" if i < 3 and data not in [rank_display] else "normal"
-                    Label(row_frame, text=data, 
-                          style=text_style, 
-                          font=("Segoe UI", 9, font_weight), 
-                          width=width).pack(side=LEFT, anchor="w")
+            Label(column, text=heading, 
+                  style=heading_style, font=("Segoe UI", 12, "bold")).pack(anchor="w")
             
-            # Show count of additional approaches if more than 15
-            if len(all_approaches) > 15:
-                more_frame = Frame(table_container, style="Modern.TFrame", padding=(15, 5))
-                more_frame.pack(fill=X)
-                Label(more_frame, text=f"... and {len(all_approaches) - 15} more approaches analyzed", 
-                      style="Secondary.TLabel", font=("Segoe UI", 9)).pack(anchor="w")
+            groups[group] = [(Label(column, style=style, font=font), template)
+                             for template, style, font in rows]
 
-        # Enhanced Recommendations with modern styling
-        recommendations = cost_data.get('recommendations', [])
-        if recommendations:
-            rec_frame = Frame(content_frame, style="Card.TFrame", padding=(20, 15))
-            rec_frame.pack(fill=X, pady=(0, 20))
-            
-            Label(rec_frame, text="💡 Cost Optimization Recommendations", 
-                  style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 10))
-            
-            # Display top recommendations with proper styling
-            for i, rec in enumerate(recommendations[:5], 1):
-                Label(rec_frame, text=f"• {rec}", 
-                      style="Secondary.TLabel", font=("Segoe UI", 10), 
-                      wraplength=900, justify="left").pack(anchor="w", padx=(20, 0), pady=2)
+        # Rebuilt for every analysis
+        body = Frame(content_frame, style="Modern.TFrame")
+        body.pack(fill=BOTH, expand=True)
 
         # Enhanced action buttons with modern styling - STAGE 3 UPDATED
         button_frame = Frame(content_frame, style="Modern.TFrame")
         button_frame.pack(fill=X, pady=20)
         
-        Button(button_frame, text="📊 Export Analysis", 
-               command=lambda: self._export_cost_analysis(cost_analysis), 
-               style="Success.TButton").pack(side=LEFT, padx=(0, 10))
+        export_btn = Button(button_frame, text="📊 Export Analysis", 
+                            style="Success.TButton")
+        export_btn.pack(side=LEFT, padx=(0, 10))
         
         Button(button_frame, text="🔄 Refresh Pricing", 
-               command=lambda: self._refresh_cost_analysis(), 
+               command=self._refresh_cost_analysis, 
                style="Secondary.TButton").pack(side=LEFT, padx=(0, 10))
         
-        Button(button_frame, text="Close", command=cleanup_dialog, 
+        Button(button_frame, text="Close", command=self._hide_cost_dialog, 
                style="Secondary.TButton").pack(side=RIGHT)
 
+        self._cost_dialog = cost_window
+        self._cost_detach = detach
+        self._cost_canvas = content_frame.master
+        self._cost_summary_frame = summary_frame
+        self._cost_body = body
+        self._cost_labels = labels
+        self._cost_groups = groups
+        self._cost_export_btn = export_btn
+
+    def _hide_cost_dialog(self):
+        """Withdraw the cost analysis window so the next analysis can reuse it"""
+        # The pointer is usually still over the canvas, so <Leave> won't unbind the wheel
+        self._cost_detach()
+        try:
+            self._cost_dialog.grab_release()
+            self._cost_dialog.withdraw()
+        except tk.TclError:
+            pass  # Dialog might already be closed
+
+    def _show_cost_group(self, name, context):
+        """Fill one group of summary value labels from context, or hide it when context is None"""
+        for label, template in self._cost_groups[name]:
+            if context is None:
+                label.pack_forget()
+            else:
+                label.config(text=template.format_map(context))
+                label.pack(anchor="w")
+
+    def _fill_cost_summary(self, summary):
+        """Update the executive summary labels for a new analysis"""
+        best_option = summary.get('best_overall', {})
+        best_context = None
+        if best_option:
+            # Calculate simple ROI metrics from best option
+            monthly_api_cost = 100  # Estimated monthly API cost for comparison
+            monthly_savings = monthly_api_cost * 0.9  # 90% savings assumption
+            training_cost = best_option.get('cost', 0)
+            break_even = training_cost / monthly_savings if monthly_savings > 0 else float('inf')
+            
+            best_context = {
+                'approach': best_option.get('best_approach', 'N/A'),
+                'cost': training_cost,
+                'hours': best_option.get('hours', 0),
+                'break_even': break_even,
+                'annual_savings': (monthly_savings * 12) - training_cost,
+                'payback_days': break_even * 30,
+            }
+        self._show_cost_group('best', best_context)
+        self._show_cost_group('roi', best_context)
+        
+        cost_range = summary.get('cost_range', {})
+        range_context = None
+        if cost_range:
+            low, high = cost_range.get('min', 0), cost_range.get('max', 0)
+            range_context = {
+                'min': low,
+                'max': high,
+                'savings': high - low,
+                'models_compared': summary.get('models_compared', 0),
+            }
+        self._show_cost_group('range', range_context)
+
+    def _sorted_approaches(self, cost_analysis):
+        """Flatten every model's cost estimates into one list sorted by cost, once per analysis"""
+        cached = self._approaches_cache
+        if cached is not None and cached[0] is cost_analysis:
+            return cached[1]
+        
+        detailed_results = cost_analysis.get('cost_analysis', {}).get('detailed_results', {})
+        approaches = []
+        for model_name, model_data in detailed_results.items():
+            if 'error' in model_data:
+                continue
+            
+            for estimate in model_data.get('cost_estimates', []):
+                # Extract hardware info
+                hw_req = estimate.get('hardware_requirements', {})
+                gpu_type = hw_req.get('gpu_type', 'Unknown')
+                gpu_count = hw_req.get('gpu_count', 1)
+                
+                approaches.append({
+                    'model': model_name,
+                    'approach': estimate['approach_name'],
+                    'cost': estimate['total_cost_usd'],
+                    'hours': estimate['training_hours'],
+                    'gpu_type': gpu_type,
+                    'gpu_count': gpu_count,
+                    'hardware': f"{gpu_type}" + (f" x{gpu_count}" if gpu_count > 1 else ""),
+                    'confidence': estimate.get('confidence', 0.8),
+                    'notes': estimate.get('notes', [])
+                })
+        
+        # Sort by cost (cheapest first)
+        approaches.sort(key=_by_cost)
+        self._approaches_cache = (cost_analysis, approaches)
+        return approaches
+
+    def _build_approaches_section(self, parent, all_approaches):
+        """Build the ranked training approaches table"""
+        approaches_frame = Frame(parent, style="Modern.TFrame")
+        approaches_frame.pack(fill=BOTH, expand=True, pady=(0, 20))
+        
+        Label(approaches_frame, text="🔧 Complete Training Approaches Comparison", 
+              style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 15))
+        
+        # Create enhanced comparison table with modern dark styling
+        table_container = Frame(approaches_frame, style="Card.TFrame")
+        table_container.pack(fill=BOTH, expand=True)
+        
+        # One Treeview renders every row instead of a Frame and seven Labels per row
+        tree = Treeview(table_container, columns=[key for key, _, _ in APPROACH_COLUMNS],
+                        show="headings", height=max(1, min(len(all_approaches), 15)))
+        for key, header, width in APPROACH_COLUMNS:
+            tree.heading(key, text=header, anchor="w")
+            tree.column(key, width=width * 9, anchor="w", stretch=False)
+        
+        # Color-coded styling based on cost efficiency
+        tree.tag_configure("top3", foreground=MODERN_SLATE['success'], font=("Segoe UI", 9, "bold"))  # Top 3 in green
+        tree.tag_configure("warn", foreground=MODERN_SLATE['warning'], font=("Segoe UI", 9))  # Expensive options in amber
+        tree.tag_configure("norm", foreground=MODERN_SLATE['text_secondary'], font=("Segoe UI", 9))  # Normal options
+        
+        # Format every cell up front so the insert loop only hands tuples to Tk
+        shown = all_approaches[:15]
+        warn_cost = all_approaches[0]['cost'] * 3 if all_approaches else 0
+        medals = ("🥇", "🥈", "🥉")
+        rows = [
+            ((
+                medals[i] if i < 3 else f"#{i+1}",  # Rank with medal icons for top 3
+                _truncate(approach['model'], 12),
+                _truncate(approach['approach'], 18),
+                f"${approach['cost']:.2f}",
+                f"{approach['hours']:.1f}h",
+                _truncate(approach['hardware'], 12),
+                f"{approach['confidence']*100:.0f}%"
+            ), "top3" if i < 3 else "warn" if approach['cost'] > warn_cost else "norm")
+            for i, approach in enumerate(shown)
+        ]
+        
+        # Display top 15 approaches with color coding
+        for row_data, tag in rows:
+            tree.insert("", "end", values=row_data, tags=(tag,))
+        
+        tree.pack(fill=X, padx=15, pady=10)
+        
+        # Show count of additional approaches if more than 15
+        if len(all_approaches) > 15:
+            more_frame = Frame(table_container, style="Modern.TFrame", padding=(15, 5))
+            more_frame.pack(fill=X)
+            Label(more_frame, text=f"... and {len(all_approaches) - 15} more approaches analyzed", 
+                  style="Secondary.TLabel", font=("Segoe UI", 9)).pack(anchor="w")
+
+    def _build_recommendations_section(self, parent, recommendations):
+        """Build the cost optimization recommendations card"""
+        rec_frame = Frame(parent, style="Card.TFrame", padding=(20, 15))
+        rec_frame.pack(fill=X, pady=(0, 20))
+        
+        Label(rec_frame, text="💡 Cost Optimization Recommendations", 
+              style="Heading.TLabel", font=("Segoe UI", 16, "bold")).pack(anchor="w", pady=(0, 10))
+        
+        # Display top recommendations with proper styling
+        for i, rec in enumerate(recommendations[:5], 1):
+            Label(rec_frame, text=f"• {rec}", 
+                  style="Secondary.TLabel", font=("Segoe UI", 10), 
+                  wraplength=900, justify="left").pack(anchor="w", padx=(20, 0), pady=2)
+
 # CONTINUING cost_dialogs.py - Part 2: Export Methods and Refresh Functionality
 
     def _export_cost_analysis(self, cost_analysis):
@@ -688,32 +903,34 @@ Would you like to start your free trial?"""
 
     def _export_json_report(self, cost_analysis, path, include_metadata, include_recommendations):
         """Export comprehensive JSON report with metadata"""
-        import json
-        
+        # Shallow copy so export_metadata and the filtered cost_analysis never reach the
+        # cached analysis; it copies only the handful of top-level keys, nested data is shared
         report = cost_analysis.copy()
         
         if include_metadata:
             # Add comprehensive metadata
+            license_status = self.parent._get_licensing_info()['license_status']
             report['export_metadata'] = {
                 'exported_at': datetime.now().isoformat(),
                 'exported_by': 'Wolfscribe Premium v2.2',
                 'export_format': 'json',
                 'dataset_info': {
                     'total_chunks': len(self.parent.chunks),
-                    'tokenizer_used': getattr(self.parent, '_current_tokenizer_name', 'gpt2'),
+                    'tokenizer_used': self._tokenizer_name,
                     'token_limit': 512,
-                    'file_processed': os.path.basename(self.parent.file_path) if self.parent.file_path else 'Unknown'
+                    'file_processed': self.parent._file_basename
                 },
                 'license_info': {
-                    'tier': self.controller.get_licensing_info()['license_status']['tier'],
-                    'status': self.controller.get_licensing_info()['license_status']['status']
+                    'tier': license_status['tier'],
+                    'status': license_status['status']
                 }
             }
         
         if not include_recommendations:
-            # Remove recommendations if not wanted
-            if 'cost_analysis' in report and 'recommendations' in report['cost_analysis']:
-                del report['cost_analysis']['recommendations']
+            # Leave recommendations out without deleting them from the cached analysis
+            cost_data = report.get('cost_analysis')
+            if cost_data and 'recommendations' in cost_data:
+                report['cost_analysis'] = {k: v for k, v in cost_data.items() if k != 'recommendations'}
         
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
@@ -722,9 +939,6 @@ Would you like to start your free trial?"""
         """Export CSV summary with cost comparison table"""
         import csv
         
-        cost_data = cost_analysis.get('cost_analysis', {})
-        detailed_results = cost_data.get('detailed_results', {})
-        
         with open(path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
@@ -733,36 +947,26 @@ Would you like to start your free trial?"""
                 writer.writerow(['# Wolfscribe Cost Analysis Report'])
                 writer.writerow([f'# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'])
                 writer.writerow([f'# Dataset: {len(self.parent.chunks)} chunks'])
-                writer.writerow([f'# Tokenizer: {getattr(self.parent, "_current_tokenizer_name", "gpt2")}'])
+                writer.writerow([f'# Tokenizer: {self._tokenizer_name}'])
                 writer.writerow([''])
             
             # Column headers
             writer.writerow(['Rank', 'Model', 'Training_Approach', 'Cost_USD', 'Time_Hours', 
                             'Hardware_Type', 'GPU_Count', 'Confidence_Percent', 'Notes'])
             
-            # Collect all approaches
-            all_approaches = []
-            for model_name, model_data in detailed_results.items():
-                if 'error' in model_data:
-                    continue
-                cost_estimates = model_data.get('cost_estimates', [])
-                for estimate in cost_estimates:
-                    hw_req = estimate.get('hardware_requirements', {})
-                    all_approaches.append([
-                        model_name,
-                        estimate['approach_name'],
-                        estimate['total_cost_usd'],
-                        estimate['training_hours'],
-                        hw_req.get('gpu_type', 'Unknown'),
-                        hw_req.get('gpu_count', 1),
-                        f"{estimate.get('confidence', 0.8) * 100:.0f}",
-                        '; '.join(estimate.get('notes', []))[:100]  # Truncate notes
-                    ])
-            
-            # Sort by cost and add rank
-            all_approaches.sort(key=lambda x: x[2])
-            for i, approach in enumerate(all_approaches, 1):
-                writer.writerow([i] + approach)
+            # Rank approaches by cost
+            for i, approach in enumerate(self._sorted_approaches(cost_analysis), 1):
+                writer.writerow([
+                    i,
+                    approach['model'],
+                    approach['approach'],
+                    approach['cost'],
+                    approach['hours'],
+                    approach['gpu_type'],
+                    approach['gpu_count'],
+                    f"{approach['confidence'] * 100:.0f}",
+                    '; '.join(approach['notes'])[:100]  # Truncate notes
+                ])
 
     def _export_text_report(self, cost_analysis, path, include_metadata, include_recommendations):
         """Export formatted text report for cost analysis"""
@@ -773,7 +977,7 @@ Would you like to start your free trial?"""
         if include_metadata:
             report += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
             report += f"Dataset: {len(self.parent.chunks)} chunks, {cost_analysis.get('dataset_info', {}).get('tokens', 0):,} tokens\n"
-            report += f"Tokenizer: {getattr(self.parent, '_current_tokenizer_name', 'gpt2')}\n\n"
+            report += f"Tokenizer: {self._tokenizer_name}\n\n"
         
         # Executive Summary
         cost_data = cost_analysis.get('cost_analysis', {})
@@ -803,32 +1007,10 @@ Would you like to start your free trial?"""
             report += "🔧 DETAILED TRAINING APPROACHES\n"
             report += "-" * 35 + "\n\n"
             
-            all_approaches = []
-            for model_name, model_data in detailed_results.items():
-                if 'error' in model_data:
-                    continue
-                cost_estimates = model_data.get('cost_estimates', [])
-                for estimate in cost_estimates:
-                    all_approaches.append({
-                        'model': model_name,
-                        'approach': estimate['approach_name'],
-                        'cost': estimate['total_cost_usd'],
-                        'hours': estimate['training_hours'],
-                        'hardware': estimate.get('hardware_requirements', {})
-                    })
-            
-            # Sort by cost
-            all_approaches.sort(key=lambda x: x['cost'])
-            
-            for i, approach in enumerate(all_approaches[:10], 1):  # Top 10
+            for i, approach in enumerate(self._sorted_approaches(cost_analysis)[:10], 1):  # Top 10
                 report += f"{i:2d}. {approach['approach']} ({approach['model']})\n"
                 report += f"    Cost: ${approach['cost']:.2f} | Time: {approach['hours']:.1f}h\n"
-                
-                hw = approach['hardware']
-                gpu_type = hw.get('gpu_type', 'Unknown')
-                gpu_count = hw.get('gpu_count', 1)
-                hardware_str = f"{gpu_type}" + (f" x{gpu_count}" if gpu_count > 1 else "")
-                report += f"    Hardware: {hardware_str}\n\n"
+                report += f"    Hardware: {approach['hardware']}\n\n"
         
         # Recommendations
         if include_recommendations:
@@ -856,6 +1038,7 @@ Would you like to start your free trial?"""
             from openpyxl import Workbook
             from openpyxl.styles import Font, Alignment, PatternFill
             from openpyxl.chart import BarChart, Reference
+            from openpyxl.utils import get_column_letter
             
             wb = Workbook()
             
@@ -870,7 +1053,7 @@ Would you like to start your free trial?"""
             if include_metadata:
                 ws_summary['A3'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
                 ws_summary['A4'] = f"Dataset: {len(self.parent.chunks)} chunks"
-                ws_summary['A5'] = f"Tokenizer: {getattr(self.parent, '_current_tokenizer_name', 'gpt2')}"
+                ws_summary['A5'] = f"Tokenizer: {self._tokenizer_name}"
             
             # Summary data
             cost_data = cost_analysis.get('cost_analysis', {})
@@ -907,56 +1090,42 @@ Would you like to start your free trial?"""
                 cell.font = Font(bold=True)
                 cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
             
-            # Data rows
-            detailed_results = cost_data.get('detailed_results', {})
-            all_approaches = []
-            
-            for model_name, model_data in detailed_results.items():
-                if 'error' in model_data:
-                    continue
-                cost_estimates = model_data.get('cost_estimates', [])
-                for estimate in cost_estimates:
-                    hw_req = estimate.get('hardware_requirements', {})
-                    hardware = f"{hw_req.get('gpu_type', 'Unknown')}"
-                    if hw_req.get('gpu_count', 1) > 1:
-                        hardware += f" x{hw_req['gpu_count']}"
-                    
-                    all_approaches.append([
-                        model_name,
-                        estimate['approach_name'],
-                        estimate['total_cost_usd'],
-                        estimate['training_hours'],
-                        hardware,
-                        estimate.get('confidence', 0.8)
-                    ])
-            
-            # Sort and populate
-            all_approaches.sort(key=lambda x: x[2])
-            for i, approach in enumerate(all_approaches, 2):
-                ws_details.cell(row=i, column=1, value=i-1)  # Rank
-                for col, value in enumerate(approach, 2):
-                    if col == 4:  # Cost column
-                        ws_details.cell(row=i, column=col, value=f"${value:.2f}")
-                    elif col == 5:  # Time column
-                        ws_details.cell(row=i, column=col, value=f"{value:.1f}h")
-                    elif col == 7:  # Confidence column
-                        ws_details.cell(row=i, column=col, value=f"{value*100:.0f}%")
-                    else:
-                        ws_details.cell(row=i, column=col, value=value)
+            # Data rows, ranked by cost
+            all_approaches = self._sorted_approaches(cost_analysis)
+            # Widest displayed value per column, tracked while rows are written
+            detail_widths = [len(header) for header in headers]
+            for rank, approach in enumerate(all_approaches, 1):
+                ws_details.append([
+                    rank,
+                    approach['model'],
+                    approach['approach'],
+                    approach['cost'],
+                    approach['hours'],
+                    approach['hardware'],
+                    approach['confidence']
+                ])
+                shown = (str(rank), approach['model'], approach['approach'], f"${approach['cost']:,.2f}",
+                         f"{approach['hours']:.1f}h", approach['hardware'], f"{approach['confidence']*100:.0f}%")
+                for j, text in enumerate(shown):
+                    if len(text) > detail_widths[j]:
+                        detail_widths[j] = len(text)
+            
+            # Cost, time and confidence stay numeric; Excel formats them for display
+            for cost_cell, hours_cell, _, confidence_cell in ws_details.iter_rows(min_row=2, min_col=4, max_col=7):
+                cost_cell.number_format = '"$"#,##0.00'
+                hours_cell.number_format = '0.0"h"'
+                confidence_cell.number_format = '0%'
             
             # Auto-adjust column widths
-            for sheet in [ws_summary, ws_details]:
-                for column in sheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+            summary_widths = {}
+            for row_values in ws_summary.iter_rows(values_only=True):
+                for j, value in enumerate(row_values, 1):
+                    if value is not None:
+                        summary_widths[j] = max(summary_widths.get(j, 0), len(str(value)))
+            for j, width in summary_widths.items():
+                ws_summary.column_dimensions[get_column_letter(j)].width = min(width + 2, 50)
+            for j, width in enumerate(detail_widths, 1):
+                ws_details.column_dimensions[get_column_letter(j)].width = min(width + 2, 50)
             
             # Add chart if requested
             if include_charts and len(all_approaches) > 1:
@@ -1,23 +1,51 @@
 # ui/dialogs/analytics_dialog.py
 import os
 import json
-from tkinter import filedialog, messagebox, Toplevel
-from ttkbootstrap import Frame, Label, Button
+import threading
+from tkinter import filedialog, messagebox, Text, Toplevel
+from ttkbootstrap import Frame, Label, Button, Notebook
 from ttkbootstrap.constants import *
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Font specs shared by every widget in this module
+_FONT_TITLE = ("Arial", 18, "bold")
+_FONT_HEADER_LG = ("Arial", 14, "bold")
+_FONT_BODY = ("Arial", 10)
+
 class AnalyticsDashboard:
     """Premium analytics dashboard for detailed tokenization insights"""
+
+    # Shared across dashboard instances so reopening reuses the formatted stats:
+    # (id(analysis), file, tokenizer) -> (analysis, {section: (body, line count)})
+    _analytics_text_cache: Dict[tuple, tuple] = {}
+
+    # The Toplevel, title and buttons are reused across openings; the notebook is
+    # rebuilt only when a different analysis, file or tokenizer is shown
+    _dashboard: Optional[Toplevel] = None
+    _dashboard_frame: Optional[Frame] = None
+    _dashboard_export_btn: Optional[Button] = None
+    _dashboard_notebook: Optional[Notebook] = None
+    _dashboard_shown: Optional[tuple] = None  # (analysis, file, tokenizer)
     
     def __init__(self, parent, controller, current_analysis: Dict[str, Any], file_path: str, tokenizer_name: str, chunks: list):
         self.parent = parent
         self.controller = controller
         self.current_analysis = current_analysis
         self.file_path = file_path
+        self._file_basename = os.path.basename(file_path) if file_path else 'Unknown'
         self.tokenizer_name = tokenizer_name
         self.chunks = chunks
         self.window = None
+        self._notebook = None
+        self._tab_builders = {}
+        self._built_tabs = set()
         
     def show(self):
         """Display the analytics dashboard"""
@@ -29,45 +57,95 @@ class AnalyticsDashboard:
             self._show_premium_upgrade_dialog()
             return
             
-        self.window = Toplevel(self.parent)
-        self.window.title("Advanced Analytics Dashboard")
-        self.window.geometry("700x800")
+        cls = AnalyticsDashboard
+        if cls._dashboard is None or not cls._dashboard.winfo_exists():
+            self._build_window()
+        self.window = cls._dashboard
+        cls._dashboard_export_btn.configure(command=self.export_analytics_report)
+        
+        shown = cls._dashboard_shown
+        if (shown is None or shown[0] is not self.current_analysis
+                or shown[1:] != (self._file_basename, self.tokenizer_name)):
+            if cls._dashboard_notebook is not None:
+                cls._dashboard_notebook.destroy()
+            # Tab contents are only built the first time a tab is shown
+            self._create_section_tabs(cls._dashboard_frame)
+            cls._dashboard_notebook = self._notebook
+            cls._dashboard_shown = (self.current_analysis, self._file_basename, self.tokenizer_name)
         
-        main_frame = Frame(self.window, padding=20)
+        self.window.deiconify()
+        self.window.lift()
+
+    def _build_window(self):
+        """Create the dashboard window with its title and buttons once"""
+        window = Toplevel(self.parent)
+        window.title("Advanced Analytics Dashboard")
+        window.geometry("700x800")
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        AnalyticsDashboard._dashboard = self.window = window
+        
+        main_frame = Frame(window, padding=20)
         main_frame.pack(fill="both", expand=True)
+        AnalyticsDashboard._dashboard_frame = main_frame
+        AnalyticsDashboard._dashboard_notebook = None
+        AnalyticsDashboard._dashboard_shown = None
         
-        # Build UI sections
+        # Buttons are packed at the bottom so each new notebook fills the space above them
         self._create_title(main_frame)
-        self._create_overview_section(main_frame)
-        self._create_token_distribution_section(main_frame)
-        self._create_cost_estimation_section(main_frame)
-        self._create_recommendations_section(main_frame)
         self._create_action_buttons(main_frame)
 
+    def _create_section_tabs(self, parent):
+        """Create one notebook tab per analytics section, populated on first selection"""
+        self._notebook = Notebook(parent)
+        self._notebook.pack(fill="both", expand=True)
+        self._tab_builders = {}
+        self._built_tabs = set()
+        
+        sections = [
+            ("📋 Overview", True, self._create_overview_section),
+            ("📈 Distribution", self.current_analysis.get('token_distribution'), self._create_token_distribution_section),
+            ("💰 Cost", self.current_analysis.get('cost_estimates'), self._create_cost_estimation_section),
+            ("💡 Recommendations", self.current_analysis.get('recommendations'), self._create_recommendations_section),
+        ]
+        for title, has_data, builder in sections:
+            if not has_data:
+                continue
+            tab = Frame(self._notebook, padding=10)
+            self._notebook.add(tab, text=title)
+            self._tab_builders[str(tab)] = builder
+        
+        self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's contents if this is its first time being shown"""
+        tab_id = self._notebook.select()
+        if not tab_id or tab_id in self._built_tabs:
+            return
+        self._built_tabs.add(tab_id)
+        self._tab_builders[tab_id](self._notebook.nametowidget(tab_id))
+
     def _create_title(self, parent):
         """Create dashboard title"""
         Label(parent, text="📊 Advanced Analytics Dashboard", 
-              font=("Arial", 18, "bold")).pack(pady=(0, 20))
+              font=_FONT_TITLE).pack(pady=(0, 20))
 
     def _create_overview_section(self, parent):
         """Create overview statistics section"""
         overview_frame = Frame(parent, relief="solid", padding=15)
         overview_frame.pack(fill="x", pady=(0, 15))
         
-        Label(overview_frame, text="📋 Overview", font=("Arial", 14, "bold")).pack(anchor="w")
+        Label(overview_frame, text="📋 Overview", font=_FONT_HEADER_LG).pack(anchor="w")
         
-        overview_stats = [
-            f"Dataset: {os.path.basename(self.file_path) if self.file_path else 'Unknown'}",
+        self._create_stats_text(overview_frame, 'overview', lambda: [
+            f"Dataset: {self._file_basename}",
             f"Tokenizer: {self.tokenizer_name}",
             f"Total Chunks: {self.current_analysis['total_chunks']:,}",
             f"Total Tokens: {self.current_analysis['total_tokens']:,}",
             f"Average Tokens/Chunk: {self.current_analysis['avg_tokens']}",
             f"Token Range: {self.current_analysis['min_tokens']} - {self.current_analysis['max_tokens']}",
             f"Efficiency Score: {self.current_analysis.get('efficiency_score', 0)}%"
-        ]
-        
-        for stat in overview_stats:
-            Label(overview_frame, text=f"• {stat}", font=("Arial", 10)).pack(anchor="w", pady=1)
+        ])
 
     def _create_token_distribution_section(self, parent):
         """Create token distribution analysis section"""
@@ -77,21 +155,19 @@ class AnalyticsDashboard:
         dist_frame = Frame(parent, relief="solid", padding=15)
         dist_frame.pack(fill="x", pady=(0, 15))
         
-        Label(dist_frame, text="📈 Token Distribution", font=("Arial", 14, "bold")).pack(anchor="w")
+        Label(dist_frame, text="📈 Token Distribution", font=_FONT_HEADER_LG).pack(anchor="w")
         
         dist = self.current_analysis['token_distribution']
         total_chunks = self.current_analysis['total_chunks']
+        inv = 100.0 / total_chunks if total_chunks else 0.0  # one divide for all five percentages
         
-        dist_stats = [
-            f"Under 50 tokens: {dist['under_50']} ({dist['under_50']/total_chunks*100:.1f}%)",
-            f"50-200 tokens: {dist['50_200']} ({dist['50_200']/total_chunks*100:.1f}%)",
-            f"200-400 tokens: {dist['200_400']} ({dist['200_400']/total_chunks*100:.1f}%)",
-            f"400-512 tokens: {dist['400_512']} ({dist['400_512']/total_chunks*100:.1f}%)",
-            f"Over limit: {dist['over_limit']} ({dist['over_limit']/total_chunks*100:.1f}%)"
-        ]
-        
-        for stat in dist_stats:
-            Label(dist_frame, text=f"• {stat}", font=("Arial", 10)).pack(anchor="w", pady=1)
+        self._create_stats_text(dist_frame, 'dist', lambda: [
+            f"Under 50 tokens: {dist['under_50']} ({dist['under_50'] * inv:.1f}%)",
+            f"50-200 tokens: {dist['50_200']} ({dist['50_200'] * inv:.1f}%)",
+            f"200-400 tokens: {dist['200_400']} ({dist['200_400'] * inv:.1f}%)",
+            f"400-512 tokens: {dist['400_512']} ({dist['400_512'] * inv:.1f}%)",
+            f"Over limit: {dist['over_limit']} ({dist['over_limit'] * inv:.1f}%)"
+        ])
 
     def _create_cost_estimation_section(self, parent):
         """Create cost estimation section"""
@@ -101,19 +177,16 @@ class AnalyticsDashboard:
         cost_frame = Frame(parent, relief="solid", padding=15)
         cost_frame.pack(fill="x", pady=(0, 15))
         
-        Label(cost_frame, text="💰 Cost Estimation", font=("Arial", 14, "bold")).pack(anchor="w")
+        Label(cost_frame, text="💰 Cost Estimation", font=_FONT_HEADER_LG).pack(anchor="w")
         
         cost = self.current_analysis['cost_estimates']
-        cost_stats = [
+        self._create_stats_text(cost_frame, 'cost', lambda: [
             f"Tokenizer: {cost['tokenizer']}",
             f"Total Tokens: {cost['total_tokens']:,}",
             f"Cost per 1K tokens: ${cost['cost_per_1k_tokens']:.4f}",
             f"Estimated API Cost: ${cost['estimated_api_cost']:.4f}",
             f"Note: {cost['note']}"
-        ]
-        
-        for stat in cost_stats:
-            Label(cost_frame, text=f"• {stat}", font=("Arial", 10)).pack(anchor="w", pady=1)
+        ])
 
     def _create_recommendations_section(self, parent):
         """Create optimization recommendations section"""
@@ -123,22 +196,56 @@ class AnalyticsDashboard:
         rec_frame = Frame(parent, relief="solid", padding=15)
         rec_frame.pack(fill="x", pady=(0, 15))
         
-        Label(rec_frame, text="💡 Optimization Recommendations", font=("Arial", 14, "bold")).pack(anchor="w")
+        Label(rec_frame, text="💡 Optimization Recommendations", font=_FONT_HEADER_LG).pack(anchor="w")
         
-        for rec in self.current_analysis['recommendations']:
-            Label(rec_frame, text=f"• {rec}", wraplength=650, font=("Arial", 10)).pack(anchor="w", pady=2)
+        self._create_stats_text(rec_frame, 'recommendations', lambda: self.current_analysis['recommendations'])
+
+    def _create_stats_text(self, parent, section, build_stats):
+        """Render a bullet list as one read-only Text widget instead of a Label per line"""
+        body, line_count = self._get_section_text(section, build_stats)
+        stats_text = Text(parent, height=line_count, wrap="word", relief="flat",
+                          borderwidth=0, font=_FONT_BODY,
+                          undo=False, maxundo=0, autoseparators=False)  # display only
+        stats_text.insert("1.0", body)
+        stats_text.config(state="disabled")
+        stats_text.pack(fill="x", anchor="w", pady=(2, 0))
+        
+        # Long bullets wrap; size the widget by display lines once its width is known
+        def fit_height(event):
+            display_lines = stats_text.count("1.0", "end", "displaylines")
+            if isinstance(display_lines, tuple):
+                display_lines = display_lines[0]
+            if display_lines and display_lines != int(stats_text.cget("height")):
+                stats_text.configure(height=display_lines)
+        
+        stats_text.bind("<Configure>", fit_height)
+
+    def _get_section_text(self, section, build_stats):
+        """Return (body, line count) for a section, formatting it only once per analysis"""
+        key = (id(self.current_analysis), self._file_basename, self.tokenizer_name)
+        entry = self._analytics_text_cache.get(key)
+        if entry is None or entry[0] is not self.current_analysis:
+            # A different analysis (or a recycled id) - drop text built for older ones
+            self._analytics_text_cache.clear()
+            entry = self._analytics_text_cache[key] = (self.current_analysis, {})
+        
+        sections = entry[1]
+        if section not in sections:
+            stats = build_stats()
+            sections[section] = ("\n".join(f"• {stat}" for stat in stats), len(stats))
+        return sections[section]
 
     def _create_action_buttons(self, parent):
         """Create action buttons section"""
         button_frame = Frame(parent)
-        button_frame.pack(fill="x", pady=(20, 0))
+        button_frame.pack(side="bottom", fill="x", pady=(20, 0))
         
         export_analytics_btn = Button(button_frame, text="📊 Export Analytics Report", 
-                                    command=self.export_analytics_report,
                                     style="Hover.TButton")
         export_analytics_btn.pack(side="left", padx=(0, 10))
+        AnalyticsDashboard._dashboard_export_btn = export_analytics_btn
         
-        close_btn = Button(button_frame, text="Close", command=self.window.destroy)
+        close_btn = Button(button_frame, text="Close", command=self.window.withdraw)
         close_btn.pack(side="right")
 
     def export_analytics_report(self):
@@ -150,54 +257,92 @@ class AnalyticsDashboard:
         
         if not path:
             return
+        
+        # Reject bad targets before any report data is built or serialized
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in ('.json', '.txt'):
+            messagebox.showerror("Export Error", "Please choose a .json or .txt file for the report.")
+            return
+        if not os.access(os.path.dirname(path) or '.', os.W_OK):
+            messagebox.showerror("Export Error", f"Cannot write to {os.path.dirname(path) or '.'}")
+            return
             
         try:
-            if path.endswith('.json'):
-                # Export as JSON
+            if ext == '.json':
+                # Export as JSON - chunk previews keep the report small regardless of chunk size
+                chunks_sample = [chunk[:200] + ("…" if len(chunk) > 200 else "") for chunk in self.chunks[:5]]
                 report_data = {
                     'file_info': {
-                        'filename': os.path.basename(self.file_path) if self.file_path else 'Unknown',
-                        'processed_at': str(datetime.now()),
+                        'filename': self._file_basename,
+                        'processed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                         'tokenizer_used': self.tokenizer_name
                     },
                     'analysis': self.current_analysis,
-                    'chunks_sample': self.chunks[:5] if len(self.chunks) > 5 else self.chunks
+                    'chunks_sample': chunks_sample
                 }
                 
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(report_data, f, indent=2, ensure_ascii=False)
-                    
+                # Serialize here so the worker thread never touches shared state
+                if ORJSON_AVAILABLE:
+                    content = orjson.dumps(
+                        report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ).decode('utf-8')
+                else:
+                    content = json.dumps(report_data, indent=2, ensure_ascii=False)
             else:
-                # Export as text report
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.write("WOLFSCRIBE ANALYTICS REPORT\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    f.write(f"File: {os.path.basename(self.file_path) if self.file_path else 'Unknown'}\n")
-                    f.write(f"Processed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Tokenizer: {self.tokenizer_name}\n\n")
-                    
-                    f.write("OVERVIEW\n")
-                    f.write("-" * 20 + "\n")
-                    f.write(f"Total Chunks: {self.current_analysis['total_chunks']:,}\n")
-                    f.write(f"Total Tokens: {self.current_analysis['total_tokens']:,}\n")
-                    f.write(f"Average Tokens: {self.current_analysis['avg_tokens']}\n")
-                    f.write(f"Min/Max Tokens: {self.current_analysis['min_tokens']} / {self.current_analysis['max_tokens']}\n")
-                    f.write(f"Over Limit: {self.current_analysis['over_limit']} ({self.current_analysis['over_limit_percentage']:.1f}%)\n")
-                    
-                    if self.current_analysis.get('efficiency_score'):
-                        f.write(f"Efficiency Score: {self.current_analysis['efficiency_score']}%\n")
-                    
-                    if self.current_analysis.get('recommendations'):
-                        f.write("\nRECOMMENDATIONS\n")
-                        f.write("-" * 20 + "\n")
-                        for i, rec in enumerate(self.current_analysis['recommendations'], 1):
-                            f.write(f"{i}. {rec}\n")
-            
-            messagebox.showinfo("Report Exported", f"Analytics report saved to {path}")
-            
+                content = self._build_text_report()
+                
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export report: {str(e)}")
+            return
+        
+        # File I/O happens off the Tk thread; results are posted back with after()
+        export_thread = threading.Thread(target=self._write_report, args=(path, content))
+        export_thread.daemon = True
+        export_thread.start()
+
+    def _write_report(self, path, content):
+        """Write the report on a worker thread and report back on the UI thread"""
+        try:
+            with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                f.write(content)
+            if hasattr(self.parent, '_flash_status'):
+                self.parent.after(0, self.parent._flash_status,
+                                  f"📊 Analytics report saved to {path}", "success")
+            else:
+                self.parent.after(0, lambda: messagebox.showinfo(
+                    "Report Exported", f"Analytics report saved to {path}"))
+        except Exception as e:
+            error = str(e)
+            self.parent.after(0, lambda: messagebox.showerror(
+                "Export Error", f"Failed to export report: {error}"))
+
+    def _build_text_report(self) -> str:
+        """Build the plain-text analytics report so it can be written in one call"""
+        analysis = self.current_analysis
+        buf = [
+            "WOLFSCRIBE ANALYTICS REPORT\n",
+            "=" * 50 + "\n\n",
+            f"File: {self._file_basename}\n",
+            f"Processed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Tokenizer: {self.tokenizer_name}\n\n",
+            "OVERVIEW\n",
+            "-" * 20 + "\n",
+            f"Total Chunks: {analysis['total_chunks']:,}\n",
+            f"Total Tokens: {analysis['total_tokens']:,}\n",
+            f"Average Tokens: {analysis['avg_tokens']}\n",
+            f"Min/Max Tokens: {analysis['min_tokens']} / {analysis['max_tokens']}\n",
+            f"Over Limit: {analysis['over_limit']} ({analysis['over_limit_percentage']:.1f}%)\n",
+        ]
+        
+        if analysis.get('efficiency_score'):
+            buf.append(f"Efficiency Score: {analysis['efficiency_score']}%\n")
+        
+        if analysis.get('recommendations'):
+            buf.append("\nRECOMMENDATIONS\n")
+            buf.append("-" * 20 + "\n")
+            buf.extend(f"{i}. {rec}\n" for i, rec in enumerate(analysis['recommendations'], 1))
+        
+        return "".join(buf)
 
     def _show_premium_upgrade_dialog(self):
         """Show premium upgrade dialog for analytics feature"""
@@ -1,13 +1,90 @@
 # ui/dialogs/premium_dialogs.py
-import tkinter as tk
-from tkinter import Text, Toplevel, messagebox
+from tkinter import Message, Text, Toplevel, messagebox
+import tkinter.font as tkfont
 from ttkbootstrap import Frame, Label, Button
 from ttkbootstrap.constants import *
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
+from functools import lru_cache
+from types import MappingProxyType
+import sys
+import threading
 import webbrowser
 
+from ui.token_cache import cached_token_count
+
+# Font specs shared by every widget in this module
+_FONT_BANNER = ("Arial", 20, "bold")
+_FONT_TITLE = ("Arial", 18, "bold")
+_FONT_HEADER_XL = ("Arial", 16, "bold")
+_FONT_HEADER_LG = ("Arial", 14, "bold")
+_FONT_HEADER_MD = ("Arial", 12, "bold")
+_FONT_HEADER_SM = ("Arial", 10, "bold")
+_FONT_BODY_LG = ("Arial", 12)
+_FONT_BODY_MD = ("Arial", 11)
+_FONT_BODY = ("Arial", 10)
+
+# Named Tk font for small bold headers, registered once per interpreter
+_NAMED_FONT_HEADER_SM = "AppBoldSmall"
+
+
+def _ensure_named_fonts(root) -> None:
+    """Register the module's named fonts with Tk if they don't exist yet"""
+    if _NAMED_FONT_HEADER_SM not in tkfont.names(root):
+        family, size, weight = _FONT_HEADER_SM
+        tkfont.Font(root=root, name=_NAMED_FONT_HEADER_SM, family=family, size=size, weight=weight)
+
+# The comparison sample is capped, so it always fits a single Message widget
+SAMPLE_TEXT_LIMIT = 2000
+
+UPGRADE_URL = "https://wolflow.ai/upgrade"
+
+
+# Default browser's open method, resolved on first successful lookup
+_browser_open_method = None
+
+
+def _browser_open():
+    """Return the default browser's open method, or None if none is registered yet"""
+    global _browser_open_method
+    if _browser_open_method is None:
+        try:
+            _browser_open_method = webbrowser.get().open
+        except webbrowser.Error:
+            return None  # Not cached: a browser may be installed later in the session
+    return _browser_open_method
+
+
+def _report_browser_error(widget, reason: str) -> None:
+    """Show a browser failure on the Tk thread"""
+    widget.after(0, lambda: messagebox.showerror("Browser Error", f"Could not open browser: {reason}"))
+
+
+def _launch_upgrade_page(widget):
+    """Open the upgrade page off the UI thread, reporting failures on it"""
+    browser_open = _browser_open()
+    if browser_open is None:
+        _report_browser_error(widget, "no web browser found")
+        return
+    try:
+        if not browser_open(UPGRADE_URL):
+            _report_browser_error(widget, "the browser did not accept the link")
+    except Exception as e:
+        _report_browser_error(widget, str(e))
+
+
+def _open_upgrade_page(widget):
+    """Open the upgrade page in a worker so the click handler returns immediately"""
+    threading.Thread(target=_launch_upgrade_page, args=(widget,), daemon=True).start()
+
+
 class TokenizerComparisonDialog:
     """Premium tokenizer comparison dialog for side-by-side analysis"""
+
+    # The window is built once and withdrawn on close; reopening only refreshes
+    # the sample text and the comparison rows
+    _comparison_window: Optional[Toplevel] = None
+    _comparison_table: Optional[Frame] = None
+    _comparison_sample: Optional[Message] = None
     
     def __init__(self, parent, controller, chunks: List[str]):
         self.parent = parent
@@ -25,119 +102,176 @@ class TokenizerComparisonDialog:
             PremiumUpgradeDialog(self.parent, self.controller, 'advanced_analytics').show()
             return
         
-        # Sample some text for comparison - avoid token length errors
-        sample_text = "\n\n".join(self.chunks[:3]) if len(self.chunks) >= 3 else "\n\n".join(self.chunks)
-        if len(sample_text) > 2000:  # Limit for comparison to avoid tokenization errors
-            sample_text = sample_text[:2000] + "..."
+        window = TokenizerComparisonDialog._comparison_window
+        if window is not None and window.winfo_exists():
+            self.window = window
+            self._refresh_window()
+            return
         
+        _ensure_named_fonts(self.parent)
         self.window = Toplevel(self.parent)
+        self.window.withdraw()
         self.window.title("Tokenizer Comparison")
         self.window.geometry("800x600")
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
+        TokenizerComparisonDialog._comparison_window = self.window
+        
+        # Build the contents once the click handler has returned
+        self.window.after_idle(self._build_window)
+
+    def _refresh_window(self):
+        """Update the cached dialog for the current chunks and show it again"""
+        if TokenizerComparisonDialog._comparison_sample is None:
+            return  # first build is still pending
+        
+        sample_text = self._build_sample_text()
+        TokenizerComparisonDialog._comparison_sample.configure(text=sample_text)
         
+        # Keep the header row, rebuild the tokenizer rows
+        comparison_frame = TokenizerComparisonDialog._comparison_table
+        for widget in comparison_frame.grid_slaves():
+            if int(widget.grid_info()["row"]) > 0:
+                widget.destroy()
+        self.window.after_idle(self._populate_comparison_rows, comparison_frame, sample_text)
+        
+        self.window.deiconify()
+        self.window.lift()
+
+    def _build_window(self):
+        """Create the dialog contents and show the window"""
+        if not self.window.winfo_exists():
+            return
+
+        # Sample some text for comparison - avoid token length errors
+        sample_text = self._build_sample_text()
+
         main_frame = Frame(self.window, padding=20)
-        main_frame.pack(fill="both", expand=True)
         
-        # Build UI sections
+        # Build UI sections while hidden so geometry is computed once for the finished tree
         self._create_header(main_frame)
         self._create_comparison_table(main_frame, sample_text)
         self._create_sample_display(main_frame, sample_text)
         self._create_close_button(main_frame)
+        main_frame.pack(fill="both", expand=True)
+        self.window.deiconify()
+
+    def _build_sample_text(self, limit: int = SAMPLE_TEXT_LIMIT) -> str:
+        """Join the first chunks into a sample, copying at most `limit` characters"""
+        pieces = []
+        for chunk in self.chunks[:3]:
+            if pieces:
+                pieces.append("\n\n")
+            pieces.append(chunk)
+
+        # Limit for comparison to avoid tokenization errors; only the piece that
+        # crosses the limit is sliced and the ellipsis is joined in, not appended
+        parts = []
+        remaining = limit
+        for piece in pieces:
+            if len(piece) > remaining:
+                parts.append(piece[:remaining])
+                parts.append("...")
+                break
+            parts.append(piece)
+            remaining -= len(piece)
+        return "".join(parts)
 
     def _create_header(self, parent):
         """Create dialog header"""
-        Label(parent, text="🔍 Tokenizer Comparison", font=("Arial", 16, "bold")).pack(pady=(0, 15))
+        Label(parent, text="🔍 Tokenizer Comparison", font=_FONT_HEADER_XL).pack(pady=(0, 15))
 
     def _create_comparison_table(self, parent, sample_text):
         """Create the tokenizer comparison table"""
         comparison_frame = Frame(parent, relief="solid", padding=10)
         comparison_frame.pack(fill="both", expand=True)
+        TokenizerComparisonDialog._comparison_table = comparison_frame
         
         # Headers
         headers = ["Tokenizer", "Token Count", "Accuracy", "Performance", "Access"]
         for i, header in enumerate(headers):
-            Label(comparison_frame, text=header, font=("Arial", 10, "bold")).grid(
+            Label(comparison_frame, text=header, font=_NAMED_FONT_HEADER_SM).grid(
                 row=0, column=i, padx=5, pady=5, sticky="w"
             )
         
-        # Compare all tokenizers with enhanced error handling
-        available_tokenizers = self.controller.get_available_tokenizers()
-        for row, tokenizer in enumerate(available_tokenizers, 1):
-            # Tokenizer name
-            Label(comparison_frame, text=tokenizer['display_name']).grid(
-                row=row, column=0, padx=5, pady=2, sticky="w"
-            )
-            
+        # Fill rows once the window is up so opening the dialog isn't blocked by tokenization
+        self.window.after_idle(self._populate_comparison_rows, comparison_frame, sample_text)
+
+    def _populate_comparison_rows(self, comparison_frame, sample_text):
+        """Add one row per tokenizer to the comparison table"""
+        if not comparison_frame.winfo_exists():
+            return
+
+        # Truncation, scale and fallback depend only on the sample; work them out once
+        if len(sample_text) > 1500:
+            test_text = sample_text[:1500]
+            scale = len(sample_text) / 1500
+        else:
+            test_text = sample_text
+            scale = 1.0
+        fallback_count = int(len(sample_text.split()) * 1.3)
+        
+        # Compare all tokenizers with enhanced error handling, collecting the
+        # (text, foreground) cells for columns 1-4 before creating any widgets
+        rows = []
+        for tokenizer in self.controller.get_available_tokenizers():
             if tokenizer['has_access'] and tokenizer['available']:
                 try:
-                    # Use truncation logic to avoid tokenization errors
-                    test_text = sample_text if len(sample_text) <= 1500 else sample_text[:1500]
-                    count, metadata = self.controller.get_token_count(test_text, tokenizer['name'])
-                    
-                    # Adjust count if text was truncated
-                    if len(sample_text) > 1500:
-                        count = int(count * (len(sample_text) / 1500))
-                    
-                    Label(comparison_frame, text=str(count)).grid(
-                        row=row, column=1, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text=metadata.get('accuracy', 'unknown')).grid(
-                        row=row, column=2, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text=metadata.get('performance', 'unknown')).grid(
-                        row=row, column=3, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text="✅", foreground="green").grid(
-                        row=row, column=4, padx=5, pady=2
-                    )
-                    
+                    count, metadata = cached_token_count(self.controller, test_text, tokenizer['name'])
+                    cells = [(str(int(count * scale)), None),
+                             (metadata.get('accuracy', 'unknown'), None),
+                             (metadata.get('performance', 'unknown'), None),
+                             ("✅", "green")]
                 except Exception as e:
                     # Fallback for tokenization errors
-                    fallback_count = int(len(sample_text.split()) * 1.3)
-                    Label(comparison_frame, text=f"~{fallback_count}", foreground="orange").grid(
-                        row=row, column=1, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text="estimated").grid(
-                        row=row, column=2, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text="error").grid(
-                        row=row, column=3, padx=5, pady=2
-                    )
-                    Label(comparison_frame, text="⚠️", foreground="orange").grid(
-                        row=row, column=4, padx=5, pady=2
-                    )
+                    cells = [(f"~{fallback_count}", "orange"),
+                             ("estimated", None),
+                             ("error", None),
+                             ("⚠️", "orange")]
             else:
-                Label(comparison_frame, text="N/A").grid(
-                    row=row, column=1, padx=5, pady=2
-                )
-                Label(comparison_frame, text=tokenizer['accuracy']).grid(
-                    row=row, column=2, padx=5, pady=2
-                )
-                Label(comparison_frame, text=tokenizer['performance']).grid(
-                    row=row, column=3, padx=5, pady=2
-                )
                 access_text = "🔒" if tokenizer['is_premium'] and not tokenizer['has_access'] else "❌"
                 access_color = "orange" if access_text == "🔒" else "red"
-                Label(comparison_frame, text=access_text, foreground=access_color).grid(
-                    row=row, column=4, padx=5, pady=2
-                )
+                cells = [("N/A", None),
+                         (tokenizer['accuracy'], None),
+                         (tokenizer['performance'], None),
+                         (access_text, access_color)]
+            rows.append((tokenizer['display_name'], cells))
+        
+        for row, (display_name, cells) in enumerate(rows, 1):
+            # Tokenizer name
+            Label(comparison_frame, text=display_name).grid(
+                row=row, column=0, padx=5, pady=2, sticky="w"
+            )
+            for column, (text, color) in enumerate(cells, 1):
+                label = Label(comparison_frame, text=text)
+                if color:
+                    label.configure(foreground=color)
+                label.grid(row=row, column=column, padx=5, pady=2)
 
     def _create_sample_display(self, parent, sample_text):
         """Create sample text display section"""
         Label(parent, text="Sample Text Used for Comparison:", 
-              font=("Arial", 10, "bold")).pack(anchor="w", pady=(15, 5))
+              font=_NAMED_FONT_HEADER_SM).pack(anchor="w", pady=(15, 5))
         
-        sample_display = Text(parent, height=8, wrap="word")
-        sample_display.pack(fill="x", pady=(0, 15))
-        sample_display.insert("1.0", sample_text)
-        sample_display.config(state="disabled")
+        # Static, read-only text: a Message lays it out once instead of a Text widget's per-line machinery
+        sample = Message(parent, text=sample_text, width=740, font=_FONT_BODY)
+        sample.pack(fill="x", pady=(0, 15))
+        TokenizerComparisonDialog._comparison_sample = sample
 
     def _create_close_button(self, parent):
         """Create close button"""
-        Button(parent, text="Close", command=self.window.destroy).pack(pady=(10, 0))
+        Button(parent, text="Close", command=self.window.withdraw).pack(pady=(10, 0))
 
 
 class PremiumUpgradeDialog:
     """Comprehensive premium upgrade dialog with trial and purchase options"""
+
+    # The layout is static apart from pricing and trial availability, so the
+    # Toplevel is built once and withdrawn/redisplayed on later calls
+    _upgrade_dialog: Optional[Toplevel] = None
+    _upgrade_feature_label: Optional[Label] = None
+    _upgrade_pricing_label: Optional[Label] = None
+    _upgrade_trial_btn: Optional[Button] = None
+    _upgrade_now_btn: Optional[Button] = None
     
     def __init__(self, parent, controller, feature_name: str = None):
         self.parent = parent
@@ -150,45 +284,78 @@ class PremiumUpgradeDialog:
         try:
             upgrade_info = self.controller.get_upgrade_info()
             
-            self.window = Toplevel(self.parent)
-            self.window.title("Premium Feature Required")
-            self.window.geometry("500x400")
-            self.window.resizable(False, False)
+            cls = PremiumUpgradeDialog
+            if cls._upgrade_dialog is None or not cls._upgrade_dialog.winfo_exists():
+                self._build_window()
+            self.window = cls._upgrade_dialog
             
-            # Center the dialog
-            self.window.transient(self.parent)
-            self.window.grab_set()
-            
-            main_frame = Frame(self.window, padding=20)
-            main_frame.pack(fill="both", expand=True)
+            # Only the dynamic parts change between calls
+            cls._upgrade_feature_label.configure(text=self._feature_info_text())
+            cls._upgrade_pricing_label.configure(text=self._pricing_text(upgrade_info))
+            cls._upgrade_trial_btn.configure(command=self._start_trial)
+            cls._upgrade_now_btn.configure(command=self._open_upgrade_url)
+            if upgrade_info['trial_available']:
+                cls._upgrade_trial_btn.pack(side="left", padx=(0, 10), before=cls._upgrade_now_btn)
+            else:
+                cls._upgrade_trial_btn.pack_forget()
             
-            # Build UI sections
-            self._create_header(main_frame)
-            self._create_feature_info(main_frame)
-            self._create_features_list(main_frame)
-            self._create_pricing_info(main_frame, upgrade_info)
-            self._create_action_buttons(main_frame, upgrade_info)
+            self.window.deiconify()
+            self.window.lift()
+            self.window.grab_set()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show upgrade dialog: {str(e)}")
 
+    def _build_window(self):
+        """Create the dialog and its widgets once"""
+        window = Toplevel(self.parent)
+        window.title("Premium Feature Required")
+        window.geometry("500x400")
+        window.resizable(False, False)
+        
+        # Center the dialog
+        window.transient(self.parent)
+        window.protocol("WM_DELETE_WINDOW", PremiumUpgradeDialog._hide)
+        PremiumUpgradeDialog._upgrade_dialog = self.window = window
+        
+        main_frame = Frame(window, padding=20)
+        main_frame.pack(fill="both", expand=True)
+        
+        # Build UI sections
+        self._create_header(main_frame)
+        self._create_feature_info(main_frame)
+        self._create_features_list(main_frame)
+        self._create_pricing_info(main_frame)
+        self._create_action_buttons(main_frame)
+
+    @staticmethod
+    def _hide():
+        """Withdraw the cached dialog instead of destroying it"""
+        window = PremiumUpgradeDialog._upgrade_dialog
+        if window is not None and window.winfo_exists():
+            window.grab_release()
+            window.withdraw()
+
     def _create_header(self, parent):
         """Create dialog header"""
-        Label(parent, text="🔒 Premium Feature", font=("Arial", 18, "bold")).pack(pady=(0, 10))
+        Label(parent, text="🔒 Premium Feature", font=_FONT_TITLE).pack(pady=(0, 10))
+
+    def _feature_info_text(self):
+        """Return the feature-specific message"""
+        if self.feature_name:
+            return "This feature requires a premium license."
+        return "Advanced features require a premium license."
 
     def _create_feature_info(self, parent):
         """Create feature-specific information"""
-        if self.feature_name:
-            feature_info = f"This feature requires a premium license."
-        else:
-            feature_info = f"Advanced features require a premium license."
-            
-        Label(parent, text=feature_info, wraplength=450, justify="left").pack(pady=(0, 10))
+        label = Label(parent, wraplength=450, justify="left")
+        label.pack(pady=(0, 10))
+        PremiumUpgradeDialog._upgrade_feature_label = label
 
     def _create_features_list(self, parent):
         """Create premium features list"""
         Label(parent, text="Premium Features Include:", 
-              font=("Arial", 12, "bold")).pack(anchor="w", pady=(10, 5))
+              font=_FONT_HEADER_MD).pack(anchor="w", pady=(10, 5))
         
         features_text = ("• Exact GPT-4 and GPT-3.5 tokenization\n"
                         "• Claude tokenizer estimation\n"
@@ -199,40 +366,46 @@ class PremiumUpgradeDialog:
         
         Label(parent, text=features_text, justify="left", wraplength=450).pack(anchor="w", pady=(0, 15))
 
-    def _create_pricing_info(self, parent, upgrade_info):
+    @staticmethod
+    def _pricing_text(upgrade_info):
+        """Return the pricing lines for the current upgrade info"""
+        return (f"Monthly: {upgrade_info['pricing']['monthly']}\n"
+                f"Yearly: {upgrade_info['pricing']['yearly']}")
+
+    def _create_pricing_info(self, parent):
         """Create pricing information section"""
-        Label(parent, text="Pricing:", font=("Arial", 12, "bold")).pack(anchor="w")
-        pricing_text = (f"Monthly: {upgrade_info['pricing']['monthly']}\n"
-                       f"Yearly: {upgrade_info['pricing']['yearly']}")
-        Label(parent, text=pricing_text, justify="left").pack(anchor="w", pady=(0, 15))
+        Label(parent, text="Pricing:", font=_FONT_HEADER_MD).pack(anchor="w")
+        label = Label(parent, justify="left")
+        label.pack(anchor="w", pady=(0, 15))
+        PremiumUpgradeDialog._upgrade_pricing_label = label
 
-    def _create_action_buttons(self, parent, upgrade_info):
+    def _create_action_buttons(self, parent):
         """Create action buttons section"""
         button_frame = Frame(parent)
         button_frame.pack(fill="x", pady=(10, 0))
         
-        if upgrade_info['trial_available']:
-            trial_button = Button(button_frame, text="🆓 Start Free Trial", 
-                                command=self._start_trial, 
-                                style="Hover.TButton")
-            trial_button.pack(side="left", padx=(0, 10))
+        # Packed or hidden in show() depending on trial availability
+        PremiumUpgradeDialog._upgrade_trial_btn = Button(button_frame, text="🆓 Start Free Trial", 
+                                                         style="Hover.TButton")
         
         upgrade_button = Button(button_frame, text="💎 Upgrade Now", 
-                              command=self._open_upgrade_url, 
                               style="Hover.TButton")
         upgrade_button.pack(side="left", padx=(0, 10))
+        PremiumUpgradeDialog._upgrade_now_btn = upgrade_button
         
-        close_button = Button(button_frame, text="Close", command=self.window.destroy)
+        close_button = Button(button_frame, text="Close", command=PremiumUpgradeDialog._hide)
         close_button.pack(side="right")
 
     def _start_trial(self):
         """Start premium trial"""
         if self.controller.start_trial():
-            self.window.destroy()
+            self._hide()
             messagebox.showinfo("Trial Started", 
                               "🎉 Your 7-day premium trial has started!\n"
                               "All premium features are now available.")
             # Refresh parent UI if possible
+            if hasattr(self.parent, 'invalidate_license_caches'):
+                self.parent.invalidate_license_caches()
             if hasattr(self.parent, 'update_tokenizer_dropdown'):
                 self.parent.update_tokenizer_dropdown()
             if hasattr(self.parent, 'update_license_status'):
@@ -246,14 +419,20 @@ class PremiumUpgradeDialog:
     def _open_upgrade_url(self):
         """Open upgrade URL in browser"""
         try:
-            webbrowser.open("https://wolflow.ai/upgrade")
-            self.window.destroy()
-        except Exception as e:
-            messagebox.showerror("Browser Error", f"Could not open browser: {str(e)}")
+            _open_upgrade_page(self.parent)
+        finally:
+            self._hide()
 
 
 class PremiumInfoDialog:
     """Premium features information dialog"""
+
+    # Built once like PremiumUpgradeDialog; later calls refresh pricing and the trial button
+    _info_dialog: Optional[Toplevel] = None
+    _info_monthly_label: Optional[Label] = None
+    _info_yearly_label: Optional[Label] = None
+    _info_trial_btn: Optional[Button] = None
+    _info_upgrade_btn: Optional[Button] = None
     
     def __init__(self, parent, controller):
         self.parent = parent
@@ -265,33 +444,62 @@ class PremiumInfoDialog:
         try:
             upgrade_info = self.controller.get_upgrade_info()
             
-            self.window = Toplevel(self.parent)
-            self.window.title("Premium Features")
-            self.window.geometry("600x500")
-            self.window.resizable(False, False)
+            cls = PremiumInfoDialog
+            if cls._info_dialog is None or not cls._info_dialog.winfo_exists():
+                self._build_window()
+            self.window = cls._info_dialog
             
-            self.window.transient(self.parent)
-            self.window.grab_set()
-            
-            main_frame = Frame(self.window, padding=20)
-            main_frame.pack(fill="both", expand=True)
+            cls._info_monthly_label.configure(text=f"Monthly: {upgrade_info['pricing']['monthly']}")
+            cls._info_yearly_label.configure(text=f"Yearly: {upgrade_info['pricing']['yearly']}")
+            cls._info_trial_btn.configure(command=self._start_trial)
+            cls._info_upgrade_btn.configure(command=self._open_upgrade_url)
+            if upgrade_info['trial_available']:
+                cls._info_trial_btn.pack(side="left", padx=(0, 10), before=cls._info_upgrade_btn)
+            else:
+                cls._info_trial_btn.pack_forget()
             
-            # Build UI sections
-            self._create_title(main_frame)
-            self._create_features_list(main_frame)
-            self._create_pricing_section(main_frame, upgrade_info)
-            self._create_action_buttons(main_frame, upgrade_info)
+            self.window.deiconify()
+            self.window.lift()
+            self.window.grab_set()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show upgrade information: {str(e)}")
 
+    def _build_window(self):
+        """Create the dialog and its widgets once"""
+        window = Toplevel(self.parent)
+        window.title("Premium Features")
+        window.geometry("600x500")
+        window.resizable(False, False)
+        
+        window.transient(self.parent)
+        window.protocol("WM_DELETE_WINDOW", PremiumInfoDialog._hide)
+        PremiumInfoDialog._info_dialog = self.window = window
+        
+        main_frame = Frame(window, padding=20)
+        main_frame.pack(fill="both", expand=True)
+        
+        # Build UI sections
+        self._create_title(main_frame)
+        self._create_features_list(main_frame)
+        self._create_pricing_section(main_frame)
+        self._create_action_buttons(main_frame)
+
+    @staticmethod
+    def _hide():
+        """Withdraw the cached dialog instead of destroying it"""
+        window = PremiumInfoDialog._info_dialog
+        if window is not None and window.winfo_exists():
+            window.grab_release()
+            window.withdraw()
+
     def _create_title(self, parent):
         """Create dialog title"""
-        Label(parent, text="💎 Wolfscribe Premium", font=("Arial", 20, "bold")).pack(pady=(0, 15))
+        Label(parent, text="💎 Wolfscribe Premium", font=_FONT_BANNER).pack(pady=(0, 15))
 
     def _create_features_list(self, parent):
         """Create detailed features list"""
-        Label(parent, text="Premium Features:", font=("Arial", 14, "bold")).pack(anchor="w", pady=(0, 10))
+        Label(parent, text="Premium Features:", font=_FONT_HEADER_LG).pack(anchor="w", pady=(0, 10))
         
         features = [
             "🎯 Exact GPT-4 & GPT-3.5 Tokenization",
@@ -302,43 +510,45 @@ class PremiumInfoDialog:
             "💾 Enhanced Export with Metadata"
         ]
         
-        for feature in features:
-            Label(parent, text=f"  {feature}", font=("Arial", 11)).pack(anchor="w", pady=1)
+        features_text = Text(parent, height=len(features), wrap="none", relief="flat",
+                             borderwidth=0, font=_FONT_BODY_MD,
+                             undo=False, maxundo=0, autoseparators=False)  # display only
+        features_text.insert("1.0", "\n".join(f"  {feature}" for feature in features))
+        features_text.config(state="disabled")
+        features_text.pack(fill="x", anchor="w")
 
-    def _create_pricing_section(self, parent, upgrade_info):
+    def _create_pricing_section(self, parent):
         """Create pricing section"""
         pricing_frame = Frame(parent, relief="solid", padding=15)
         pricing_frame.pack(fill="x", pady=(20, 15))
         
-        Label(pricing_frame, text="💰 Pricing", font=("Arial", 14, "bold")).pack(anchor="w")
-        Label(pricing_frame, text=f"Monthly: {upgrade_info['pricing']['monthly']}", 
-              font=("Arial", 12)).pack(anchor="w")
-        Label(pricing_frame, text=f"Yearly: {upgrade_info['pricing']['yearly']}", 
-              font=("Arial", 12)).pack(anchor="w")
+        Label(pricing_frame, text="💰 Pricing", font=_FONT_HEADER_LG).pack(anchor="w")
+        PremiumInfoDialog._info_monthly_label = Label(pricing_frame, font=_FONT_BODY_LG)
+        PremiumInfoDialog._info_monthly_label.pack(anchor="w")
+        PremiumInfoDialog._info_yearly_label = Label(pricing_frame, font=_FONT_BODY_LG)
+        PremiumInfoDialog._info_yearly_label.pack(anchor="w")
 
-    def _create_action_buttons(self, parent, upgrade_info):
+    def _create_action_buttons(self, parent):
         """Create action buttons"""
         button_frame = Frame(parent)
         button_frame.pack(fill="x", pady=(10, 0))
         
-        if upgrade_info['trial_available']:
-            trial_button = Button(button_frame, text="🆓 Start Free Trial", 
-                                command=self._start_trial, 
-                                style="Hover.TButton")
-            trial_button.pack(side="left", padx=(0, 10))
+        # Packed or hidden in show() depending on trial availability
+        PremiumInfoDialog._info_trial_btn = Button(button_frame, text="🆓 Start Free Trial", 
+                                                   style="Hover.TButton")
         
         upgrade_button = Button(button_frame, text="💎 Upgrade Now", 
-                              command=self._open_upgrade_url, 
                               style="Hover.TButton")
         upgrade_button.pack(side="left", padx=(0, 10))
+        PremiumInfoDialog._info_upgrade_btn = upgrade_button
         
-        close_button = Button(button_frame, text="Maybe Later", command=self.window.destroy)
+        close_button = Button(button_frame, text="Maybe Later", command=PremiumInfoDialog._hide)
         close_button.pack(side="right")
 
     def _start_trial(self):
         """Start trial from info dialog"""
         if self.controller.start_trial():
-            self.window.destroy()
+            self._hide()
             messagebox.showinfo("Trial Started", 
                               "🎉 Welcome to Wolfscribe Premium!\n\n"
                               "Your 7-day trial includes:\n"
@@ -347,6 +557,8 @@ class PremiumInfoDialog:
                               "• Smart chunking features\n\n"
                               "Enjoy exploring the premium features!")
             # Refresh parent UI if possible
+            if hasattr(self.parent, 'invalidate_license_caches'):
+                self.parent.invalidate_license_caches()
             if hasattr(self.parent, 'update_tokenizer_dropdown'):
                 self.parent.update_tokenizer_dropdown()
             if hasattr(self.parent, 'update_license_status'):
@@ -361,52 +573,98 @@ class PremiumInfoDialog:
     def _open_upgrade_url(self):
         """Open upgrade URL in browser"""
         try:
-            webbrowser.open("https://wolflow.ai/upgrade")
-            self.window.destroy()
-        except Exception as e:
-            messagebox.showerror("Browser Error", f"Could not open browser: {str(e)}")
+            _open_upgrade_page(self.parent)
+        finally:
+            self._hide()
 
 
 class TokenizerDisplayHelper:
     """Helper class for tokenizer display information"""
+
+    # name -> tokenizer info, rebuilt when the controller or its tokenizer_version changes
+    _info_map: Optional[Dict[str, Dict[str, Any]]] = None
+    _info_map_key: Optional[tuple] = None
+    # name -> display info for the same controller state as _info_map
+    _display_info_cache: Dict[str, Mapping[str, str]] = {}
+
+    @classmethod
+    def _get_tokenizer_info_map(cls, controller) -> Dict[str, Dict[str, Any]]:
+        """Return the tokenizer info keyed by name, listing tokenizers only when stale"""
+        key = (id(controller), getattr(controller, 'tokenizer_version', None))
+        if cls._info_map is None or cls._info_map_key != key:
+            cls._info_map = {t['name']: t for t in controller.get_available_tokenizers()}
+            cls._info_map_key = key
+            cls._display_info_cache = {}
+        return cls._info_map
     
     @staticmethod
-    def get_tokenizer_display_info(controller, tokenizer_name: str) -> Dict[str, str]:
-        """Get formatted display information for a tokenizer"""
+    def get_tokenizer_display_info(controller, tokenizer_name: str) -> Mapping[str, str]:
+        """Get formatted display information for a tokenizer (read-only, shared between calls)"""
         try:
-            tokenizer_info = next((t for t in controller.get_available_tokenizers() 
-                                 if t['name'] == tokenizer_name), None)
+            info_map = TokenizerDisplayHelper._get_tokenizer_info_map(controller)
+            cached = TokenizerDisplayHelper._display_info_cache.get(tokenizer_name)
+            if cached is not None:
+                return cached
             
+            tokenizer_info = info_map.get(tokenizer_name)
             if not tokenizer_info:
-                return {
-                    'display_name': tokenizer_name,
-                    'accuracy_badge': '📊 Estimated',
-                    'performance_badge': '❓ Unknown',
-                    'premium_badge': '❓ Unknown',
-                    'status': 'Unknown tokenizer'
-                }
+                return _unknown_display_info(tokenizer_name)
             
-            accuracy_badge = "🎯 Exact" if tokenizer_info['accuracy'] == 'exact' else "📊 Estimated"
-            performance_badge = f"⚡ {tokenizer_info['performance'].title()}"
-            premium_badge = "💎 Premium" if tokenizer_info['is_premium'] else "🆓 Free"
-            
-            status = "Available" if tokenizer_info['available'] else "Unavailable"
-            if not tokenizer_info['has_access']:
-                status += " (Premium Required)"
-            
-            return {
-                'display_name': tokenizer_info['display_name'],
-                'accuracy_badge': accuracy_badge,
-                'performance_badge': performance_badge, 
-                'premium_badge': premium_badge,
-                'status': status
-            }
+            display_info = _format_tokenizer_display(
+                tokenizer_info['display_name'],
+                tokenizer_info['accuracy'],
+                tokenizer_info['performance'],
+                tokenizer_info['is_premium'],
+                tokenizer_info['available'],
+                tokenizer_info['has_access'],
+            )
+            TokenizerDisplayHelper._display_info_cache[tokenizer_name] = display_info
+            return display_info
             
-        except Exception as e:
-            return {
-                'display_name': tokenizer_name,
-                'accuracy_badge': '📊 Estimated',
-                'performance_badge': '❓ Unknown', 
-                'premium_badge': '❓ Unknown',
-                'status': 'Error loading info'
-            }
\ No newline at end of file
+        except (KeyError, AttributeError, TypeError):
+            return _unknown_display_info(tokenizer_name, error=True)
+
+
+# Badge strings keyed by the raw tokenizer attribute values; interned so
+# comparisons against them elsewhere can short-circuit on identity
+_ACCURACY_BADGES = {'exact': sys.intern('🎯 Exact')}
+_DEFAULT_ACCURACY = sys.intern('📊 Estimated')
+_PERF_BADGES = {
+    'fast': sys.intern('⚡ Fast'),
+    'medium': sys.intern('⚡ Medium'),
+    'slow': sys.intern('⚡ Slow'),
+}
+_PREMIUM_BADGES = {True: sys.intern('💎 Premium'), False: sys.intern('🆓 Free')}
+_UNKNOWN_BADGE = sys.intern('❓ Unknown')
+
+# Fallback display info shared by every tokenizer without usable metadata
+_UNKNOWN_TOKENIZER_TEMPLATE = MappingProxyType({
+    'accuracy_badge': _DEFAULT_ACCURACY,
+    'performance_badge': _UNKNOWN_BADGE,
+    'premium_badge': _UNKNOWN_BADGE,
+    'status': 'Unknown tokenizer'
+})
+_ERROR_TEMPLATE = MappingProxyType({**_UNKNOWN_TOKENIZER_TEMPLATE, 'status': 'Error loading info'})
+
+
+def _format_tokenizer_display(display_name: str, accuracy: str, performance: str,
+                              is_premium: bool, available: bool, has_access: bool) -> Mapping[str, str]:
+    """Build the badge strings for one combination of tokenizer attributes"""
+    status = "Available" if available else "Unavailable"
+    if not has_access:
+        status += " (Premium Required)"
+    
+    return MappingProxyType({
+        'display_name': display_name,
+        'accuracy_badge': _ACCURACY_BADGES.get(accuracy, _DEFAULT_ACCURACY),
+        'performance_badge': _PERF_BADGES.get(performance, _UNKNOWN_BADGE),
+        'premium_badge': _PREMIUM_BADGES[bool(is_premium)],
+        'status': status
+    })
+
+
+@lru_cache(maxsize=128)
+def _unknown_display_info(tokenizer_name: str, error: bool = False) -> Mapping[str, str]:
+    """Display info for a tokenizer whose metadata isn't available"""
+    template = _ERROR_TEMPLATE if error else _UNKNOWN_TOKENIZER_TEMPLATE
+    return MappingProxyType({**template, 'display_name': tokenizer_name})
@@ -1,14 +1,71 @@
 # ui/dialogs/preview_dialog.py
 import tkinter as tk
-from tkinter import Text, Toplevel
+import tkinter.font as tkfont
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import Text, Toplevel, messagebox
 from ttkbootstrap import Frame, Label, Button
 from ttkbootstrap.constants import *
 from typing import List, Dict, Any, Optional
 
+from .analytics_dialog import AnalyticsDashboard
+from ui.token_cache import cached_token_count
+
 TOKEN_LIMIT = 512
+PREVIEW_CHUNK_LIMIT = 10  # chunks shown in the preview
+CALIBRATION_SAMPLE_CHARS = 2000  # characters tokenized to calibrate chars-per-token
+
+# Chunk header badges, looked up per chunk
+_PERF_ICONS = {"fast": "⚡", "medium": "⚖️", "slow": "🐌"}
+_ACC_ICON = {"exact": "🎯"}
+_ACC_LABEL = {"exact": "Exact", "estimated": "Estimated"}
+
+# Chunk header template and text tag per status bucket
+_HEADER_TPL = {
+    "over": "🔴 Chunk {i} | {count} tokens | Over limit{accuracy_suffix}{perf_suffix}{eff_suffix}\n",
+    "close": "🟡 Chunk {i} | {count} tokens | Close to limit{accuracy_suffix}{perf_suffix}{eff_suffix}\n",
+    "optimal": "🟢 Chunk {i} | {count} tokens | Optimal{accuracy_suffix}{perf_suffix}{eff_suffix}\n",
+}
+_HEADER_TAG = {status: f"chunk_header_{status}" for status in _HEADER_TPL}
+
+# Upgrade teaser shown in place of premium analytics, joined once at import
+_PREVIEW_FEATURES = (
+    "🎯 Efficiency scoring and optimization suggestions",
+    "💰 Training cost estimation by provider",
+    "📊 Detailed token distribution analysis",
+    "🔍 Model compatibility recommendations",
+)
+_PREVIEW_FEATURES_TEXT = "\n".join(_PREVIEW_FEATURES)
+
+# Named fonts used by the preview dialog: key -> (family, size, weight)
+_FONT_SPECS = {
+    "h1": ("Arial", 16, "bold"),
+    "h2": ("Arial", 14, "bold"),
+    "h3": ("Arial", 12, "bold"),
+    "subtitle": ("Arial", 11, "normal"),
+    "stat_label": ("Arial", 10, "bold"),
+    "stat_value": ("Arial", 12, "normal"),
+    "body": ("Arial", 10, "normal"),
+    "small": ("Arial", 9, "normal"),
+    "mono": ("Consolas", 10, "normal"),
+    "mono_small": ("Consolas", 9, "normal"),
+}
 
 class ChunkPreviewDialog:
     """Enhanced chunk preview dialog with advanced tokenizer information and analytics"""
+
+    # Shared by all instances and kept alive for the app's lifetime (Tk deletes a Font when it is collected)
+    _fonts: Dict[str, tkfont.Font] = {}
+    _tokenizer_pool: Optional[ThreadPoolExecutor] = None
+
+    # Chunk text tags: (tag, foreground, _FONT_SPECS key or None)
+    _CHUNK_TAGS = (
+        ("chunk_header_optimal", "#059669", "stat_label"),
+        ("chunk_header_close", "#d97706", "stat_label"),
+        ("chunk_header_over", "#dc2626", "stat_label"),
+        ("chunk_content", "#374151", "mono_small"),
+        ("metadata", "#6b7280", "small"),
+        ("separator", "#d1d5db", None),
+    )
     
     def __init__(self, parent, chunks: List[str], controller, tokenizer_name: str = 'gpt2', current_analysis: Optional[Dict[str, Any]] = None):
         self.parent = parent
@@ -17,14 +74,29 @@ class ChunkPreviewDialog:
         self.tokenizer_name = tokenizer_name
         self.current_analysis = current_analysis
         self.window = None
+        self._has_advanced = False
+        self._rate_tokenizer = None  # tokenizer the chars-per-token rate was calibrated for
+        self._chars_per_token = None
+        self._rate_metadata = {}
+        # Word counts for the tokenization fallback, counted once rather than split() per render
+        self._chunk_words = [c.count(' ') + c.count('\n') + 1 for c in (chunks or [])[:PREVIEW_CHUNK_LIMIT]]
+        
+        if ChunkPreviewDialog._tokenizer_pool is None:
+            ChunkPreviewDialog._tokenizer_pool = ThreadPoolExecutor(max_workers=4)
+        
+        if not self._fonts:
+            for key, (family, size, weight) in _FONT_SPECS.items():
+                ChunkPreviewDialog._fonts[key] = tkfont.Font(root=parent, family=family, size=size, weight=weight)
         
     def show(self):
         """Display the preview dialog"""
         if not self.chunks:
-            from tkinter import messagebox
             messagebox.showwarning("No Data", "You must process a file first.")
             return
 
+        # License state can't change while the dialog is being built; check it once
+        self._has_advanced = self.controller.license_manager.check_feature_access('advanced_analytics')
+
         # Update analysis if needed
         if not self.current_analysis:
             self._update_chunk_analysis()
@@ -54,7 +126,7 @@ class ChunkPreviewDialog:
             self.current_analysis = self.controller.analyze_chunks(self.chunks, self.tokenizer_name, TOKEN_LIMIT)
             
             # Add enhanced analysis for premium users
-            if self.controller.license_manager.check_feature_access('advanced_analytics'):
+            if self._has_advanced:
                 # Add tokenizer-specific recommendations
                 tokenizer_info = next((t for t in self.controller.get_available_tokenizers() 
                                      if t['name'] == self.tokenizer_name), None)
@@ -72,7 +144,6 @@ class ChunkPreviewDialog:
                     self.current_analysis['recommendations'] = enhanced_recommendations
                     
         except Exception as e:
-            from tkinter import messagebox
             messagebox.showerror("Analysis Error", f"Failed to analyze chunks: {str(e)}")
 
     def _create_header_section(self, parent):
@@ -85,7 +156,7 @@ class ChunkPreviewDialog:
         title_frame.pack(fill="x", padx=20, pady=15)
         
         Label(title_frame, text="📊 Advanced Chunk Analysis", 
-              font=("Arial", 16, "bold")).pack(anchor="w")
+              font=self._fonts["h1"]).pack(anchor="w")
         
         # Tokenizer status line
         tokenizer_info = self.controller.get_available_tokenizers()
@@ -101,7 +172,7 @@ class ChunkPreviewDialog:
             tokenizer_status = f"Tokenizer: {self.tokenizer_name} | Status: Unknown"
         
         Label(title_frame, text=tokenizer_status, 
-              font=("Arial", 11)).pack(anchor="w", pady=(5, 0))
+              font=self._fonts["subtitle"]).pack(anchor="w", pady=(5, 0))
 
     def _create_analytics_summary(self, parent):
         """Create analytics summary panel"""
@@ -116,7 +187,7 @@ class ChunkPreviewDialog:
         header.pack(fill="x", padx=20, pady=(15, 10))
         
         Label(header, text="📈 Summary Statistics", 
-              font=("Arial", 14, "bold")).pack(anchor="w")
+              font=self._fonts["h2"]).pack(anchor="w")
 
         # Create stats grid
         stats_container = Frame(analytics_frame)
@@ -138,8 +209,8 @@ class ChunkPreviewDialog:
             stat_frame = Frame(stats_container, relief="solid", borderwidth=1)
             stat_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
             
-            Label(stat_frame, text=label, font=("Arial", 10, "bold")).pack(pady=(8, 2))
-            Label(stat_frame, text=value, font=("Arial", 12)).pack(pady=(0, 8))
+            Label(stat_frame, text=label, font=self._fonts["stat_label"]).pack(pady=(8, 2))
+            Label(stat_frame, text=value, font=self._fonts["stat_value"]).pack(pady=(0, 8))
         
         # Configure grid weights
         stats_container.columnconfigure(0, weight=1)
@@ -151,7 +222,7 @@ class ChunkPreviewDialog:
             premium_frame.pack(fill="x", padx=20, pady=(10, 15))
             
             Label(premium_frame, text="💎 Premium Analytics", 
-                  font=("Arial", 12, "bold"), foreground="blue").pack(anchor="w", padx=15, pady=(10, 5))
+                  font=self._fonts["h3"], foreground="blue").pack(anchor="w", padx=15, pady=(10, 5))
             
             premium_stats_text = []
             
@@ -166,11 +237,7 @@ class ChunkPreviewDialog:
                 dist = self.current_analysis['token_distribution']
                 premium_stats_text.append(f"📊 Distribution: {dist['under_50']} small | {dist['50_200']} medium | {dist['200_400']} large | {dist['over_limit']} oversized")
             
-            for stat in premium_stats_text:
-                Label(premium_frame, text=stat, font=("Arial", 10)).pack(anchor="w", padx=15, pady=1)
-            
-            # Add padding at bottom
-            Label(premium_frame, text="").pack(pady=5)
+            self._create_lines_text(premium_frame, "\n".join(premium_stats_text), len(premium_stats_text))
         
         else:
             # Show premium preview
@@ -178,44 +245,43 @@ class ChunkPreviewDialog:
             preview_frame.pack(fill="x", padx=20, pady=(10, 15))
             
             Label(preview_frame, text="💡 Upgrade for Advanced Analytics", 
-                  font=("Arial", 12, "bold"), foreground="orange").pack(anchor="w", padx=15, pady=(10, 5))
-            
-            preview_features = [
-                "🎯 Efficiency scoring and optimization suggestions",
-                "💰 Training cost estimation by provider", 
-                "📊 Detailed token distribution analysis",
-                "🔍 Model compatibility recommendations"
-            ]
-            
-            for feature in preview_features:
-                Label(preview_frame, text=feature, font=("Arial", 10)).pack(anchor="w", padx=15, pady=1)
+                  font=self._fonts["h3"], foreground="orange").pack(anchor="w", padx=15, pady=(10, 5))
             
-            Label(preview_frame, text="").pack(pady=5)
+            self._create_lines_text(preview_frame, _PREVIEW_FEATURES_TEXT, len(_PREVIEW_FEATURES))
+
+    def _create_lines_text(self, parent, text, line_count, foreground=None):
+        """Render pre-joined lines as one read-only Text widget instead of a Label per line"""
+        lines_text = Text(parent, height=line_count, wrap="none", relief="flat",
+                          borderwidth=0, font=self._fonts["body"],
+                          undo=False, maxundo=0, autoseparators=False)  # display only
+        if foreground:
+            lines_text.configure(foreground=foreground)
+        lines_text.insert("1.0", text)
+        lines_text.config(state="disabled")
+        lines_text.pack(fill="x", anchor="w", padx=15, pady=(1, 15))
 
     def _create_compatibility_warnings(self, parent):
         """Create compatibility warnings section"""
         try:
             # Check for compatibility issues
             warnings = self.controller.tokenizer_manager.get_compatibility_warnings(self.tokenizer_name)
+            has_access = self.controller.license_manager.check_tokenizer_access(self.tokenizer_name)
             
-            if warnings or not self.controller.license_manager.check_tokenizer_access(self.tokenizer_name):
+            if warnings or not has_access:
                 warning_frame = Frame(parent, relief="solid", borderwidth=1)
                 warning_frame.pack(fill="x", pady=(0, 15))
                 
                 Label(warning_frame, text="⚠️ Compatibility Notices", 
-                      font=("Arial", 12, "bold"), foreground="red").pack(anchor="w", padx=15, pady=(10, 5))
-                
-                # Show access warnings
-                if not self.controller.license_manager.check_tokenizer_access(self.tokenizer_name):
-                    Label(warning_frame, text="🔒 Using fallback tokenizer - premium tokenizer access required", 
-                          font=("Arial", 10), foreground="red").pack(anchor="w", padx=15, pady=1)
-                
-                # Show compatibility warnings
-                for warning in warnings:
-                    Label(warning_frame, text=f"• {warning}", font=("Arial", 10), 
-                          foreground="red").pack(anchor="w", padx=15, pady=1)
+                      font=self._fonts["h3"], foreground="red").pack(anchor="w", padx=15, pady=(10, 5))
                 
-                Label(warning_frame, text="").pack(pady=5)
+                # Access warning first, then compatibility warnings, in one widget
+                notices = "\n".join(f"• {warning}" for warning in warnings)
+                line_count = len(warnings)
+                if not has_access:
+                    access_notice = "🔒 Using fallback tokenizer - premium tokenizer access required"
+                    notices = f"{access_notice}\n{notices}" if notices else access_notice
+                    line_count += 1
+                self._create_lines_text(warning_frame, notices, line_count, foreground="red")
         
         except Exception as e:
             # Silently handle any compatibility checking errors
@@ -231,17 +297,18 @@ class ChunkPreviewDialog:
         preview_header.pack(fill="x", padx=20, pady=(15, 10))
         
         Label(preview_header, text="📋 Chunk Preview (First 10)", 
-              font=("Arial", 14, "bold")).pack(anchor="w")
+              font=self._fonts["h2"]).pack(anchor="w")
         
         Label(preview_header, text="Color coding: 🟢 Optimal | 🟡 Close to limit | 🔴 Over limit", 
-              font=("Arial", 10)).pack(anchor="w", pady=(5, 0))
+              font=self._fonts["body"]).pack(anchor="w", pady=(5, 0))
 
         # Scrollable text widget for chunks
         text_frame = Frame(preview_frame)
         text_frame.pack(fill="both", expand=True, padx=20, pady=(0, 15))
         
         # Use regular tkinter Text widget
-        text_widget = Text(text_frame, wrap="word", font=("Consolas", 10), relief="flat", bd=0)
+        text_widget = Text(text_frame, wrap="word", font=self._fonts["mono"], relief="flat", bd=0,
+                           undo=False, maxundo=0, autoseparators=False)
         scrollbar = tk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
         
@@ -253,102 +320,159 @@ class ChunkPreviewDialog:
 
     def _populate_enhanced_chunks(self, text_widget):
         """Populate text widget with enhanced chunk information"""
-        # Configure color tags
-        text_widget.tag_config("chunk_header_optimal", foreground="#059669", font=("Arial", 10, "bold"))
-        text_widget.tag_config("chunk_header_close", foreground="#d97706", font=("Arial", 10, "bold"))
-        text_widget.tag_config("chunk_header_over", foreground="#dc2626", font=("Arial", 10, "bold"))
-        text_widget.tag_config("chunk_content", foreground="#374151", font=("Consolas", 9))
-        text_widget.tag_config("metadata", foreground="#6b7280", font=("Arial", 9))
-        text_widget.tag_config("separator", foreground="#d1d5db")
-        
-        chunks_to_show = min(10, len(self.chunks))
-        
-        for i in range(chunks_to_show):
-            chunk = self.chunks[i]
+        # Configure color tags once per widget
+        if not getattr(text_widget, "_ws_tags_configured", False):
+            for tag, foreground, font_key in self._CHUNK_TAGS:
+                if font_key:
+                    text_widget.tag_configure(tag, foreground=foreground, font=self._fonts[font_key])
+                else:
+                    text_widget.tag_configure(tag, foreground=foreground)
+            text_widget._ws_tags_configured = True
+        
+        # Tokenize off the Tk thread; the widget is filled once the counts are back
+        chunks = self.chunks[:PREVIEW_CHUNK_LIMIT]
+        future = self._tokenizer_pool.submit(self._compute_chunk_tokens, chunks, self.tokenizer_name)
+        future.add_done_callback(lambda f: self._schedule_render(text_widget, chunks, f))
+
+    def _schedule_render(self, text_widget, chunks, future):
+        """Pool thread: hand the finished future back to the Tk thread"""
+        try:
+            text_widget.after(0, self._render_chunks, text_widget, chunks, future)
+        except tk.TclError:
+            pass  # Dialog closed while tokenizing
+
+    def _compute_chunk_tokens(self, chunks, tokenizer_name):
+        """Return (count, metadata) for each chunk; runs on the tokenizer pool"""
+        rate = self._get_chars_per_token(tokenizer_name)
+        results = []
+        for i, chunk in enumerate(chunks):
+            # Estimate from the calibrated rate; only chunks near the limit need an exact count
+            if rate:
+                estimate = round(len(chunk) / rate)
+                if abs(estimate - TOKEN_LIMIT) >= TOKEN_LIMIT * 0.1:
+                    results.append((estimate, dict(self._rate_metadata, accuracy='estimated')))
+                    continue
             
             # Truncate very long chunks before tokenization to avoid sequence length errors
             chunk_for_tokenization = chunk if len(chunk) <= 2000 else chunk[:2000]
             
             # Get token count and metadata with error handling
             try:
-                count, metadata = self.controller.get_token_count(chunk_for_tokenization, self.tokenizer_name)
+                count, metadata = cached_token_count(self.controller, chunk_for_tokenization, tokenizer_name)
                 # If chunk was truncated, add approximate adjustment
                 if len(chunk) > 2000:
                     count = int(count * (len(chunk) / 2000))
                     metadata['truncated'] = True
             except Exception as e:
                 # Fallback to word-based estimation
-                count = int(len(chunk.split()) * 1.3)
+                count = int(self._chunk_words[i] * 1.3)
                 metadata = {'accuracy': 'estimated', 'error': f'Tokenization error: {str(e)[:50]}...'}
-            
-            # Determine color coding and status
-            if count > TOKEN_LIMIT:
-                header_tag = "chunk_header_over"
-                status_icon = "🔴"
-                efficiency = "Over limit"
-            elif count > TOKEN_LIMIT * 0.9:
-                header_tag = "chunk_header_close"
-                status_icon = "🟡"
-                efficiency = "Close to limit"
-            else:
-                header_tag = "chunk_header_optimal"
-                status_icon = "🟢"
-                efficiency = "Optimal"
-            
-            # Create chunk header
-            header_text = f"{status_icon} Chunk {i+1} | {int(count)} tokens | {efficiency}"
-            
-            # Add accuracy and performance info if available
-            if metadata.get('accuracy'):
-                accuracy_icon = "🎯" if metadata['accuracy'] == 'exact' else "📊"
-                header_text += f" | {accuracy_icon} {metadata['accuracy'].title()}"
-            
-            if metadata.get('performance'):
-                perf_icon = {"fast": "⚡", "medium": "⚖️", "slow": "🐌"}.get(metadata['performance'], "")
-                header_text += f" {perf_icon}"
-            
-            # Add premium features info
-            if self.controller.license_manager.check_feature_access('advanced_analytics'):
-                # Calculate efficiency percentage
-                efficiency_pct = min(100, int((min(count, TOKEN_LIMIT) / (TOKEN_LIMIT * 0.9)) * 100))
-                header_text += f" | Efficiency: {efficiency_pct}%"
-            
-            text_widget.insert("end", header_text + "\n", header_tag)
-            
-            # Add metadata line
-            metadata_line = f"Length: {len(chunk)} chars"
-            if metadata.get('error'):
-                metadata_line += f" | Error: {metadata['error']}"
-            elif metadata.get('access_denied'):
-                metadata_line += f" | 🔒 Premium tokenizer access required"
-            elif metadata.get('truncated'):
-                metadata_line += f" | ⚠️ Chunk truncated for tokenization"
-            
-            text_widget.insert("end", metadata_line + "\n", "metadata")
-            
-            # Add chunk content (truncated if very long for display)
-            chunk_preview = chunk if len(chunk) <= 500 else chunk[:500] + "..."
-            text_widget.insert("end", chunk_preview + "\n", "chunk_content")
-            
-            # Add separator (except for last chunk)
-            if i < chunks_to_show - 1:
-                text_widget.insert("end", "─" * 80 + "\n\n", "separator")
+            results.append((count, metadata))
+        return results
+
+    def _get_chars_per_token(self, tokenizer_name):
+        """Characters per token for this file, calibrated once per tokenizer from the first chunk"""
+        if self._rate_tokenizer != tokenizer_name:
+            self._rate_tokenizer = tokenizer_name
+            self._chars_per_token = None
+            sample = self.chunks[0][:CALIBRATION_SAMPLE_CHARS]
+            try:
+                count, metadata = cached_token_count(self.controller, sample, tokenizer_name)
+                if count > 0:
+                    self._chars_per_token = len(sample) / count
+                    self._rate_metadata = metadata
+            except Exception:
+                pass  # Uncalibrated: every chunk is tokenized individually
+        return self._chars_per_token
+
+    def _render_chunks(self, text_widget, chunks, future):
+        """Insert the formatted chunks into the preview text widget"""
+        if not text_widget.winfo_exists():
+            return  # Dialog closed while tokenizing
+        
+        try:
+            results = future.result()
+        except Exception as e:
+            messagebox.showerror("Preview Error", f"Failed to tokenize chunks: {str(e)}", parent=text_widget)
+            return
+        
+        segments = []
+        last = len(chunks) - 1
+        for i, (chunk, (count, metadata)) in enumerate(zip(chunks, results)):
+            segments.extend(self._format_chunk(i, chunk, count, metadata, i == last))
         
         # Add summary if showing partial chunks
-        if len(self.chunks) > 10:
-            summary_text = f"\n... and {len(self.chunks) - 10} more chunks\n"
-            text_widget.insert("end", summary_text, "metadata")
+        if len(self.chunks) > PREVIEW_CHUNK_LIMIT:
+            segments.append((f"\n... and {len(self.chunks) - PREVIEW_CHUNK_LIMIT} more chunks\n", "metadata"))
+        
+        # Tk's insert takes alternating text/tag arguments, so everything is one call
+        args = [item for segment in segments for item in segment]
+        text_widget.config(state="normal")
+        text_widget.insert("end", *args)
         
         # Disable editing
         text_widget.config(state="disabled")
 
+    def _format_chunk(self, i, chunk, count, metadata, is_last):
+        """Return the (text, tag) segments describing one preview chunk"""
+        segments = []
+        
+        # Determine color coding and status
+        if count > TOKEN_LIMIT:
+            status = "over"
+        elif count > TOKEN_LIMIT * 0.9:
+            status = "close"
+        else:
+            status = "optimal"
+        
+        # Optional header parts are empty strings when the info isn't available
+        accuracy = metadata.get('accuracy')
+        performance = metadata.get('performance')
+        header_ctx = {
+            "i": i + 1,
+            "count": int(count),
+            "accuracy_suffix": (f" | {_ACC_ICON.get(accuracy, '📊')} {_ACC_LABEL.get(accuracy) or accuracy.title()}"
+                                if accuracy else ""),
+            "perf_suffix": f" {_PERF_ICONS.get(performance, '')}" if performance else "",
+            # Efficiency percentage is a premium feature
+            "eff_suffix": (f" | Efficiency: {min(100, int((min(count, TOKEN_LIMIT) / (TOKEN_LIMIT * 0.9)) * 100))}%"
+                           if self._has_advanced else ""),
+        }
+        segments.append((_HEADER_TPL[status].format_map(header_ctx), _HEADER_TAG[status]))
+        
+        # Add metadata line
+        metadata_line = f"Length: {len(chunk)} chars"
+        if metadata.get('error'):
+            metadata_line += f" | Error: {metadata['error']}"
+        elif metadata.get('access_denied'):
+            metadata_line += f" | 🔒 Premium tokenizer access required"
+        elif metadata.get('truncated'):
+            metadata_line += f" | ⚠️ Chunk truncated for tokenization"
+        
+        segments.append((metadata_line + "\n", "metadata"))
+        
+        # Add chunk content (truncated if very long for display)
+        # The ellipsis goes in its own segment so the slice is never concatenated
+        if len(chunk) <= 500:
+            segments.append((chunk, "chunk_content"))
+            segments.append(("\n", "chunk_content"))
+        else:
+            segments.append((chunk[:500], "chunk_content"))
+            segments.append(("...\n", "chunk_content"))
+        
+        # Add separator (except for last chunk)
+        if not is_last:
+            segments.append(("─" * 80 + "\n\n", "separator"))
+        
+        return segments
+
     def _create_action_buttons(self, parent):
         """Create action buttons section"""
         button_frame = Frame(parent)
         button_frame.pack(fill="x", pady=(15, 0))
         
         # Advanced analytics button (premium feature)
-        if self.controller.license_manager.check_feature_access('advanced_analytics'):
+        if self._has_advanced:
             analytics_btn = Button(button_frame, text="📊 Advanced Analytics Dashboard", 
                                   command=self._show_analytics_dashboard,
                                   style="Hover.TButton")
@@ -360,7 +484,7 @@ class ChunkPreviewDialog:
             upgrade_btn.pack(side="left", padx=(0, 10))
         
         # Tokenizer comparison button (premium feature) 
-        if self.controller.license_manager.check_feature_access('advanced_analytics'):
+        if self._has_advanced:
             compare_btn = Button(button_frame, text="🔍 Compare Tokenizers", 
                                command=self._show_tokenizer_comparison,
                                style="Hover.TButton")
@@ -372,8 +496,6 @@ class ChunkPreviewDialog:
 
     def _show_analytics_dashboard(self):
         """Show analytics dashboard using extracted AnalyticsDashboard"""
-        from .analytics_dialog import AnalyticsDashboard
-        
         analytics_dashboard = AnalyticsDashboard(
             parent=self.parent,
             controller=self.controller,
@@ -387,11 +509,9 @@ class ChunkPreviewDialog:
     def _show_premium_upgrade(self):
         """Show premium upgrade dialog (to be implemented)"""
         # This will be implemented when premium dialogs are extracted
-        from tkinter import messagebox
         messagebox.showinfo("Premium Required", "Premium upgrade dialog will be available after next extraction.")
 
     def _show_tokenizer_comparison(self):
         """Show tokenizer comparison (to be implemented)"""
         # This will be implemented when premium dialogs are extracted
-        from tkinter import messagebox
         messagebox.showinfo("Coming Soon", "Tokenizer comparison will be available after next extraction.")
\ No newline at end of file
@@ -1,20 +1,25 @@
 # ui/preview_dialogs.py - Preview & Dialog System (Stage 2)
 
-import os
 import tkinter as tk
 from tkinter import messagebox
-from ttkbootstrap import Frame, Label, Button
+from ttkbootstrap import Frame, Button
 from ttkbootstrap.constants import *
 from ui.styles import MODERN_SLATE
+from ui.token_cache import cached_token_count
 
 TOKEN_LIMIT = 512
 
+# Font for the chunk preview text
+_FONT_MONO = ("Consolas", 10)
+
 class PreviewDialogs:
     """Handles all preview and dialog functionality for Wolfscribe"""
     
     def __init__(self, parent, controller):
         self.parent = parent
         self.controller = controller
+        self._preview_window = None
+        self._preview_text = None
         
     def preview_chunks(self, chunks):
         """Enhanced preview with modern dark styling and proper scrolling"""
@@ -22,93 +27,129 @@ class PreviewDialogs:
             messagebox.showwarning("No Data", "You must process a file first.")
             return
 
-        tokenizer_name = getattr(self.parent, '_current_tokenizer_name', 'gpt2')
+        tokenizer_name = self.parent._current_tokenizer_name
         
         try:
-            # Create preview window
-            preview_window = tk.Toplevel(self.parent)
-            preview_window.title("👁️ Chunk Preview")
-            preview_window.geometry("900x650")
-            preview_window.transient(self.parent)
-            preview_window.grab_set()
-            preview_window.configure(bg=MODERN_SLATE['bg_primary'])
-            
-            # Center the window
-            preview_window.geometry("+%d+%d" % (
-                preview_window.winfo_screenwidth()//2 - 450,
-                preview_window.winfo_screenheight()//2 - 325
-            ))
+            content = self._build_preview_content(chunks, tokenizer_name)
             
-            # Create content frame
-            content_frame = Frame(preview_window, style="Card.TFrame", padding=(20, 20))
-            content_frame.pack(fill=BOTH, expand=True, padx=15, pady=15)
-            
-            # Add chunk content with enhanced analysis
-            content = f"📊 CHUNK PREVIEW - {len(chunks)} chunks processed\n"
-            content += f"🔧 Tokenizer: {tokenizer_name}\n"
-            content += f"📏 Token Limit: {TOKEN_LIMIT}\n"
-            content += "=" * 70 + "\n\n"
+            # The window is built once and reused; only its text changes between opens
+            preview_window, text_widget = self._get_preview_window()
+            # Word wrapping is off while the text goes in, so lines are measured
+            # in one relayout when it is restored rather than during the insert
+            text_widget.config(state="normal", wrap=tk.NONE)
+            text_widget.delete("1.0", "end")
+            text_widget.mark_set("insert", "1.0")
+            text_widget.insert("1.0", content)
+            text_widget.config(state="disabled", wrap=tk.WORD)
             
-            # Show first 10 chunks with detailed token analysis
-            for i, chunk in enumerate(chunks[:10]):
-                count, metadata = self.controller.get_token_count(chunk, tokenizer_name)
-                
-                # Color-coded status indicators
-                if count <= TOKEN_LIMIT * 0.8:
-                    status = "🟢 OPTIMAL"
-                elif count <= TOKEN_LIMIT:
-                    status = "🟡 GOOD"
-                else:
-                    status = "🔴 OVER LIMIT"
-                
-                efficiency = (min(count, TOKEN_LIMIT) / TOKEN_LIMIT) * 100
-                
-                content += f"{status} | Chunk {i+1:2d} | {count:4d} tokens | {efficiency:5.1f}% efficiency\n"
-                content += f"{'─' * 70}\n"
-                
-                # Truncate chunk content for preview
-                preview_text = chunk[:300] + "..." if len(chunk) > 300 else chunk
-                content += f"{preview_text}\n\n"
+        except Exception as e:
+            messagebox.showerror("Preview Error", f"Failed to show preview: {str(e)}")
+
+    def _build_preview_content(self, chunks, tokenizer_name):
+        """Build the preview text for the first chunks plus summary statistics"""
+        # Add chunk content with enhanced analysis
+        content = f"📊 CHUNK PREVIEW - {len(chunks)} chunks processed\n"
+        content += f"🔧 Tokenizer: {tokenizer_name}\n"
+        content += f"📏 Token Limit: {TOKEN_LIMIT}\n"
+        content += "=" * 70 + "\n\n"
+        
+        # Show first 10 chunks with detailed token analysis
+        for i, chunk in enumerate(chunks[:10]):
+            count, metadata = cached_token_count(self.controller, chunk, tokenizer_name)
             
-            if len(chunks) > 10:
-                content += f"{'═' * 70}\n"
-                content += f"... and {len(chunks) - 10} more chunks (showing first 10)\n\n"
-                
-                # Add summary statistics
-                if self.parent.current_analysis:
-                    analysis = self.parent.current_analysis
-                    content += f"📈 SUMMARY STATISTICS:\n"
-                    content += f"• Total Chunks: {analysis['total_chunks']}\n"
-                    content += f"• Total Tokens: {analysis['total_tokens']:,}\n"
-                    content += f"• Average Tokens: {analysis['avg_tokens']:.1f}\n"
-                    content += f"• Over Limit: {analysis['over_limit']} ({analysis['over_limit_percentage']:.1f}%)\n"
-                    if analysis.get('efficiency_score'):
-                        content += f"• Efficiency Score: {analysis['efficiency_score']}%\n"
+            # Color-coded status indicators
+            if count <= TOKEN_LIMIT * 0.8:
+                status = "🟢 OPTIMAL"
+            elif count <= TOKEN_LIMIT:
+                status = "🟡 GOOD"
+            else:
+                status = "🔴 OVER LIMIT"
             
-            # Use Text widget with proper scrolling
-            text_widget = tk.Text(content_frame, 
-                                 wrap=tk.WORD, 
-                                 font=("Consolas", 10),
-                                 bg=MODERN_SLATE['bg_cards'],
-                                 fg=MODERN_SLATE['text_primary'],
-                                 insertbackground=MODERN_SLATE['accent_cyan'],
-                                 selectbackground=MODERN_SLATE['accent_blue'],
-                                 selectforeground="white",
-                                 borderwidth=1,
-                                 relief="solid",
-                                 height=25)
-            text_widget.pack(fill=BOTH, expand=True, pady=(0, 15))
+            efficiency = (min(count, TOKEN_LIMIT) / TOKEN_LIMIT) * 100
             
-            text_widget.insert("1.0", content)
-            text_widget.config(state="disabled")
+            content += f"{status} | Chunk {i+1:2d} | {count:4d} tokens | {efficiency:5.1f}% efficiency\n"
+            content += f"{'─' * 70}\n"
             
-            # Add close button
-            Button(content_frame, text="Close Preview", 
-                   command=preview_window.destroy,
-                   style="Secondary.TButton").pack()
+            # Truncate chunk content for preview
+            if len(chunk) > 300:
+                content += f"{chunk[:300]}...\n\n"
+            else:
+                content += f"{chunk}\n\n"
+        
+        if len(chunks) > 10:
+            content += f"{'═' * 70}\n"
+            content += f"... and {len(chunks) - 10} more chunks (showing first 10)\n\n"
             
-        except Exception as e:
-            messagebox.showerror("Preview Error", f"Failed to show preview: {str(e)}")
+            # Add summary statistics
+            if self.parent.current_analysis:
+                analysis = self.parent.current_analysis
+                content += f"📈 SUMMARY STATISTICS:\n"
+                content += f"• Total Chunks: {analysis['total_chunks']}\n"
+                content += f"• Total Tokens: {analysis['total_tokens']:,}\n"
+                content += f"• Average Tokens: {analysis['avg_tokens']:.1f}\n"
+                content += f"• Over Limit: {analysis['over_limit']} ({analysis['over_limit_percentage']:.1f}%)\n"
+                if analysis.get('efficiency_score'):
+                    content += f"• Efficiency Score: {analysis['efficiency_score']}%\n"
+        
+        return content
+
+    def _get_preview_window(self):
+        """Return the (window, text widget) pair, creating the preview window on first use"""
+        if self._preview_window is not None and self._preview_window.winfo_exists():
+            self._preview_window.deiconify()
+            self._preview_window.lift()
+            self._preview_window.grab_set()
+            return self._preview_window, self._preview_text
+        
+        # Create preview window
+        preview_window = tk.Toplevel(self.parent)
+        preview_window.title("👁️ Chunk Preview")
+        preview_window.geometry("900x650")
+        preview_window.transient(self.parent)
+        preview_window.grab_set()
+        preview_window.configure(bg=MODERN_SLATE['bg_primary'])
+        preview_window.protocol("WM_DELETE_WINDOW", self._hide_preview_window)
+        
+        # Center the window
+        preview_window.geometry("+%d+%d" % (
+            self.parent._scr_w//2 - 450,
+            self.parent._scr_h//2 - 325
+        ))
+        
+        # Create content frame
+        content_frame = Frame(preview_window, style="Card.TFrame", padding=(20, 20))
+        content_frame.pack(fill=BOTH, expand=True, padx=15, pady=15)
+        
+        # Use Text widget with proper scrolling
+        text_widget = tk.Text(content_frame, 
+                             wrap=tk.WORD, 
+                             font=_FONT_MONO,
+                             bg=MODERN_SLATE['bg_cards'],
+                             fg=MODERN_SLATE['text_primary'],
+                             insertbackground=MODERN_SLATE['accent_cyan'],
+                             selectbackground=MODERN_SLATE['accent_blue'],
+                             selectforeground="white",
+                             borderwidth=1,
+                             relief="solid",
+                             height=25,
+                             undo=False,  # read-only preview, refilled on every open
+                             maxundo=0,
+                             autoseparators=False)
+        text_widget.pack(fill=BOTH, expand=True, pady=(0, 15))
+        
+        # Add close button
+        Button(content_frame, text="Close Preview", 
+               command=self._hide_preview_window,
+               style="Secondary.TButton").pack()
+        
+        self._preview_window = preview_window
+        self._preview_text = text_widget
+        return preview_window, text_widget
+
+    def _hide_preview_window(self):
+        """Hide the preview window so the next preview can reuse it"""
+        self._preview_window.grab_release()
+        self._preview_window.withdraw()
 
     def create_premium_analytics_window(self, analysis=None):
         """Enhanced analytics with modern styling"""
@@ -131,7 +172,7 @@ Dataset Overview:
 
 Performance Metrics:
 • Efficiency Score: {analysis.get('efficiency_score', 0)}% 
-• Tokenizer: {getattr(self.parent, '_current_tokenizer_name', 'gpt2')}
+• Tokenizer: {self.parent._current_tokenizer_name}
 • Processing Method: {self.parent.split_method.get()}"""
             
             # Add cost preview if available
@@ -185,7 +226,7 @@ Performance Metrics:
             return
         
         try:
-            available_tokenizers = self.controller.get_available_tokenizers()
+            available_tokenizers = self.parent._get_tokenizers()
             
             # Get sample text for comparison
             sample_text = chunks[0][:500] if chunks else "Sample text for comparison"
@@ -199,7 +240,7 @@ Performance Metrics:
             for tokenizer in available_tokenizers[:5]:  # Limit to 5 tokenizers
                 if tokenizer['available']:
                     try:
-                        count, metadata = self.controller.get_token_count(sample_text, tokenizer['name'])
+                        count, metadata = cached_token_count(self.controller, sample_text, tokenizer['name'])
                         access_icon = "✅" if tokenizer['has_access'] else "🔒"
                         premium_indicator = " (Premium)" if tokenizer['is_premium'] else " (Free)"
                         
@@ -377,6 +418,7 @@ Thank you for supporting Wolfscribe Premium! 🎉"""
                     "Enjoy exploring Wolfscribe Premium!")
                 
                 # Update parent UI elements
+                self.parent.invalidate_license_caches()
                 self.parent.update_tokenizer_dropdown()
                 self.parent.update_license_status()
                 self.parent.update_premium_section()
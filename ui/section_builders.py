@@ -129,10 +129,15 @@ class SectionBuilder:
             self.app.license_status_label = license_status_label
 
         # Process button with enhanced styling
-        Button(preprocess_section, image=self.icons["clean"], 
-               text="  Process Text", compound="left",
-               command=self._get_process_callback(), 
-               style="Primary.TButton").pack(fill="x", pady=(0, 8))
+        process_button = Button(preprocess_section, image=self.icons["clean"], 
+                                text="  Process Text", compound="left",
+                                command=self._get_process_callback(), 
+                                style="Primary.TButton")
+        process_button.pack(fill="x", pady=(0, 8))
+        
+        # Store reference so the app can disable it while processing
+        if self.app:
+            self.app.process_button = process_button
 
         # Cost Analysis Button with comprehensive tooltip
         cost_button = Button(preprocess_section, 
@@ -0,0 +1,22 @@
+# ui/token_cache.py - Token counts shared by the preview and comparison dialogs
+import hashlib
+from typing import Dict
+
+# (blake2b digest of text, tokenizer_name) -> (count, metadata), shared by every preview
+_token_counts: Dict[tuple, tuple] = {}
+TOKEN_CACHE_SIZE = 4096
+
+
+def cached_token_count(controller, text: str, tokenizer_name: str):
+    """Return controller.get_token_count(text, tokenizer_name), memoized by text digest"""
+    key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), tokenizer_name)
+    cached = _token_counts.get(key)
+    if cached is None:
+        cached = controller.get_token_count(text, tokenizer_name)
+        # Denied results fall back to another tokenizer; recount once access is granted
+        if not cached[1].get('access_denied'):
+            if len(_token_counts) >= TOKEN_CACHE_SIZE:
+                _token_counts.clear()
+            _token_counts[key] = cached
+    count, metadata = cached
+    return count, dict(metadata)  # callers annotate their own copy